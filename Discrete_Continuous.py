@@ -11,10 +11,17 @@ import matplotlib
 matplotlib.use("TkAgg")
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter, MultipleLocator
 import tkinter as tk
 from tkinter import messagebox
 import os
 
+try:
+    from numba import njit
+except ImportError:                      # numba is optional
+    def njit(*args, **kwargs):
+        return lambda f: f
+
 OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # ── Colour theme ─────────────────────────────────────────────
@@ -31,25 +38,48 @@ COLORS   = {
     'mul': '#6A1B9A',   # deep purple
 }
 
+# Value-label box style; face colour is filled in per signal
+_LABEL_BBOX = dict(boxstyle='round,pad=0.15', ec='none', alpha=0.85)
+
 
 # ═══════════════════════════════════════════════════════════════
 def parse_array(text: str):
     """Parse '4, 7, 2' or '[4 7 2]' into a numpy int/float array."""
-    text = text.strip().strip('[]')
-    vals = [float(v) for v in text.replace(',', ' ').split()]
-    return np.array(vals)
+    tokens = text.strip().strip('[]').replace(',', ' ').split()
+    return np.fromiter(map(float, tokens), dtype=float, count=len(tokens))
 
 
 def pad_to_same(a: np.ndarray, b: np.ndarray):
     """Zero-pad the shorter array so both have the same length."""
-    diff = len(a) - len(b)
-    if diff > 0:
-        b = np.concatenate([b, np.zeros(diff)])
-    elif diff < 0:
-        a = np.concatenate([a, np.zeros(-diff)])
+    N = max(a.size, b.size)
+    if a.size < N:
+        a = np.pad(a, (0, N - a.size))
+    if b.size < N:
+        b = np.pad(b, (0, N - b.size))
     return a, b
 
 
+def _is_int_vec(a: np.ndarray):
+    """True when every sample is a whole number."""
+    return not np.any(a % 1)
+
+
+def _display_list(a: np.ndarray):
+    """Plain list for titles, shown as ints when the signal is integral."""
+    return a.astype(int).tolist() if _is_int_vec(a) else a.tolist()
+
+
+@njit(cache=True)
+def _label_offsets(x):
+    """Point offset of each value label: above positive stems, below negative."""
+    return np.where(x >= 0, 9.0, -14.0)
+
+
+def _int_tick(v, _pos):
+    """x-tick label for sample index v."""
+    return str(int(v))
+
+
 # ═══════════════════════════════════════════════════════════════
 def draw_stem(ax, n, x, color, title, ylabel="x[n]", annotate=True):
     """Draw a single styled stem plot with value annotations."""
@@ -62,9 +92,10 @@ def draw_stem(ax, n, x, color, title, ylabel="x[n]", annotate=True):
     ml.set_markerfacecolor(color)
     ml.set_markeredgecolor(color)
     ml.set_markersize(8)
-    import matplotlib.pyplot as plt
-    plt.setp(sl, linewidth=2.0, alpha=0.8, color=color)
-    plt.setp(bl, linewidth=0.8)
+    sl.set_linewidth(2.0)
+    sl.set_alpha(0.8)
+    sl.set_color(color)
+    bl.set_linewidth(0.8)
 
     ax.set_title(title, color=color, fontsize=10, pad=5, fontfamily='monospace')
     ax.set_ylabel(ylabel, color=FG, fontsize=9)
@@ -74,23 +105,23 @@ def draw_stem(ax, n, x, color, title, ylabel="x[n]", annotate=True):
 
     # ── Value label above/below each stem head ────────────────
     if annotate:
-        for ni, xi in zip(n, x):
-            offset = 9 if xi >= 0 else -14
+        offsets = _label_offsets(np.asarray(x, dtype=float))
+        bbox = {**_LABEL_BBOX, 'fc': color}
+        for ni, xi, off in zip(n, x, offsets):
             ax.annotate(
                 f"{xi:g}",
                 xy=(ni, xi),
-                xytext=(0, offset),
+                xytext=(0, int(off)),
                 textcoords='offset points',
                 fontsize=9, fontweight='bold',
                 color='#ffffff',
                 ha='center', va='bottom',
-                bbox=dict(boxstyle='round,pad=0.15', fc=color,
-                          ec='none', alpha=0.85)
+                bbox=bbox
             )
 
-    # ── Tick marks at every integer n ────────────────────────
-    ax.set_xticks(n)
-    ax.set_xticklabels([str(int(ni)) for ni in n], color=FG, fontsize=8)
+    # ── Tick marks at every integer n (labels formatted lazily) ──
+    ax.xaxis.set_major_locator(MultipleLocator(1))
+    ax.xaxis.set_major_formatter(FuncFormatter(_int_tick))
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -101,6 +132,7 @@ class DiscreteArrayApp:
         self.root.title("Discrete Signal Array Operations")
         self.root.configure(bg=BG)
         self.root.state('zoomed')
+        self._cache = None              # ((x1 bytes, x2 bytes), (add, sub, mul))
         self._build_ui()
         self._update()
 
@@ -189,6 +221,7 @@ class DiscreteArrayApp:
     # ── Canvas ────────────────────────────────────────────────
     def _build_canvas(self, parent):
         self.fig = Figure(figsize=(11, 10), dpi=95, facecolor=BG)
+        self.axes = self.fig.subplots(5, 1)
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
@@ -209,18 +242,26 @@ class DiscreteArrayApp:
         N  = len(x1)
         n  = np.arange(n0, n0 + N)
 
-        add = x1 + x2
-        sub = x1 - x2
-        mul = x1 * x2
-
-        # ── Draw 5 subplots ───────────────────────────────────
-        self.fig.clear()
-        self.fig.patch.set_facecolor(BG)
-        axes = self.fig.subplots(5, 1)
+        # Editing only n0 shifts the axis; the operations themselves are reused
+        key = (x1.tobytes(), x2.tobytes())
+        if self._cache is not None and self._cache[0] == key:
+            add, sub, mul = self._cache[1]
+        else:
+            R = np.empty((3, N))
+            np.add(x1, x2, out=R[0])
+            np.subtract(x1, x2, out=R[1])
+            np.multiply(x1, x2, out=R[2])
+            add, sub, mul = R
+            self._cache = (key, (add, sub, mul))
+
+        # ── Redraw the 5 persistent subplots ──────────────────
+        axes = self.axes
+        for ax in axes:
+            ax.cla()
 
         self.fig.suptitle(
-            f"Discrete Signal Operations    x\u2081={list(x1.astype(int) if all(v==int(v) for v in x1) else x1)}    "
-            f"x\u2082={list(x2.astype(int) if all(v==int(v) for v in x2) else x2)}",
+            f"Discrete Signal Operations    x\u2081={_display_list(x1)}    "
+            f"x\u2082={_display_list(x2)}",
             color=FG, fontsize=11, fontweight='bold', y=0.995)
 
         draw_stem(axes[0], n, x1,  COLORS['x1'],  f"x\u2081[n]  =  {fmt(x1)}")
@@ -230,18 +271,16 @@ class DiscreteArrayApp:
         draw_stem(axes[4], n, mul, COLORS['mul'], f"x\u2081[n] \u00d7 x\u2082[n]  =  {fmt(mul)}")
 
         self.fig.tight_layout(rect=[0, 0, 1, 0.97])
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
         # ── Update matrix ─────────────────────────────────────
         self.matrix.config(state='normal')
         self.matrix.delete('1.0', 'end')
         hdr = f"{'n':>4} | {'x1[n]':>8} | {'x2[n]':>8} | {'ADD':>8} | {'SUB':>8} | {'MUL':>8}\n"
-        self.matrix.insert('end', hdr)
-        self.matrix.insert('end', '-' * 58 + '\n')
-        for i, ni in enumerate(n):
-            row = (f"{int(ni):>4} | {x1[i]:>8.3g} | {x2[i]:>8.3g} | "
-                   f"{add[i]:>8.3g} | {sub[i]:>8.3g} | {mul[i]:>8.3g}\n")
-            self.matrix.insert('end', row)
+        rows = [f"{int(ni):>4} | {x1[i]:>8.3g} | {x2[i]:>8.3g} | "
+                f"{add[i]:>8.3g} | {sub[i]:>8.3g} | {mul[i]:>8.3g}\n"
+                for i, ni in enumerate(n)]
+        self.matrix.insert('end', hdr + '-' * 58 + '\n' + ''.join(rows))
         self.matrix.config(state='disabled')
 
     # ── Save ──────────────────────────────────────────────────
@@ -260,8 +299,9 @@ class DiscreteArrayApp:
 
 def fmt(arr):
     """Format array as [4 7 2] style."""
-    vals = [f"{v:g}" for v in arr]
-    return "[" + "  ".join(vals) + "]"
+    return np.array2string(arr, separator='  ', max_line_width=np.inf,
+                           threshold=arr.size,
+                           formatter={'float_kind': lambda v: format(v, 'g')})
 
 
 # ═══════════════════════════════════════════════════════════════
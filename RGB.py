@@ -1,5 +1,5 @@
 import tkinter as tk
-import math
+import numpy as np
 
 # Approx color database (can expand to 1000 later)
 COLOR_DB = {
@@ -25,21 +25,57 @@ COLOR_DB = {
     "Maroon": (128, 0, 0),
 }
 
+# Palette as an (N, 3) array so the nearest-colour search is one vectorized pass
+NAMES = list(COLOR_DB.keys())
+PALETTE = np.array(list(COLOR_DB.values()), dtype=np.int32)
+
+def _build_lut():
+    """Nearest palette index for every 4-wide RGB bin, as a (64, 64, 64) table.
+
+    Built one red slice at a time so the distance matrix stays 4096 x N.
+    """
+    centres = np.arange(2, 256, 4)
+    gg, bb = np.meshgrid(centres, centres, indexing="ij")
+    p2 = np.einsum("ij,ij->i", PALETTE, PALETTE)
+    lut = np.empty((64, 64, 64), dtype=np.min_scalar_type(len(NAMES) - 1))
+    for i, r in enumerate(centres):
+        grid = np.stack([np.full(gg.size, r), gg.ravel(), bb.ravel()], axis=1)
+        # |grid - p|^2 without the |grid|^2 term, which is constant per row
+        d = p2 - 2 * (grid @ PALETTE.T)
+        lut[i] = d.argmin(1).reshape(64, 64)
+    return lut
+
+LUT = _build_lut()
+
 def closest_color(r, g, b):
-    min_dist = float("inf")
-    closest_name = "Unknown"
+    return NAMES[LUT[r >> 2, g >> 2, b >> 2]]
 
-    for name, (cr, cg, cb) in COLOR_DB.items():
-        dist = math.sqrt((r-cr)**2 + (g-cg)**2 + (b-cb)**2)
-        if dist < min_dist:
-            min_dist = dist
-            closest_name = name
+# Two-char hex per channel value, so building "#rrggbb" is plain concatenation
+_HEX = [f"{i:02x}" for i in range(256)]
 
-    return closest_name
+# Pending after() id; slider drags fire many events, only the latest one is drawn
+_pending = None
+
+# Current channel values, fed straight from each Scale's command argument
+rgb = [0, 0, 0]
+
+def channel_setter(i):
+    def on_change(value):
+        rgb[i] = int(float(value))
+        update_color()
+    return on_change
 
 def update_color(event=None):
-    r, g, b = red.get(), green.get(), blue.get()
-    color = f"#{r:02x}{g:02x}{b:02x}"
+    global _pending
+    if _pending is not None:
+        root.after_cancel(_pending)
+    _pending = root.after(15, _do_update)
+
+def _do_update():
+    global _pending
+    _pending = None
+    r, g, b = rgb
+    color = "#" + _HEX[r] + _HEX[g] + _HEX[b]
 
     preview.config(bg=color)
     name = closest_color(r, g, b)
@@ -50,21 +86,17 @@ root = tk.Tk()
 root.title("RGB Color Name Picker")
 root.geometry("400x350")
 
-red = tk.IntVar()
-green = tk.IntVar()
-blue = tk.IntVar()
-
 tk.Label(root, text="Red").pack()
 tk.Scale(root, from_=0, to=255, orient="horizontal",
-         variable=red, command=update_color).pack(fill="x")
+         command=channel_setter(0)).pack(fill="x")
 
 tk.Label(root, text="Green").pack()
 tk.Scale(root, from_=0, to=255, orient="horizontal",
-         variable=green, command=update_color).pack(fill="x")
+         command=channel_setter(1)).pack(fill="x")
 
 tk.Label(root, text="Blue").pack()
 tk.Scale(root, from_=0, to=255, orient="horizontal",
-         variable=blue, command=update_color).pack(fill="x")
+         command=channel_setter(2)).pack(fill="x")
 
 preview = tk.Label(root, bg="black", width=40, height=5)
 preview.pack(pady=10)
@@ -72,5 +104,5 @@ preview.pack(pady=10)
 label = tk.Label(root, text="")
 label.pack()
 
-update_color()
+_do_update()
 root.mainloop()
@@ -11,14 +11,17 @@ import numpy as np
 import matplotlib
 matplotlib.use("TkAgg")
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
-from matplotlib.patches import FancyArrowPatch, FancyBboxPatch, Circle, Rectangle
+from matplotlib.patches import FancyArrowPatch, FancyBboxPatch, Circle, Rectangle, Wedge
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 from matplotlib.gridspec import GridSpec
 import tkinter as tk
 from tkinter import ttk
+from functools import lru_cache, partial
 import os
 
 # ── White Theme Palette ───────────────────────────────────────
@@ -46,10 +49,40 @@ COLORS = {
 
 SLIDER_W = 255
 
+# ── Constant Matplotlib style kwargs (copied by Matplotlib on use) ──
+_ARROW_CURRENT  = dict(arrowstyle='->', color=COLORS['current'], lw=2, mutation_scale=15)
+_BBOX_KVL_OK    = dict(boxstyle='round,pad=0.35', fc='#e8f5e9', ec='#2e7d32', lw=1.5)
+_BBOX_VN        = dict(boxstyle='round,pad=0.25', fc='white', ec=COLORS['node'], lw=1.2)
+_PIE_TEXTPROPS  = dict(fontsize=8, color=FG, fontfamily='monospace')
+_PIE_PCTPROPS   = dict(fontsize=7.5, color='white', fontfamily='monospace', fontweight='bold')
+_PIE_WEDGEPROPS = dict(edgecolor='white', linewidth=2.5)
+_LEGEND_PROP    = {'family': 'monospace', 'size': 8}
+_KCL_BRANCH_COLORS = [COLORS['r1'], COLORS['r2'], COLORS['r3']]
+_BBOX_KCL_R = [dict(boxstyle='round,pad=0.35', fc=SUBPANEL, ec=c, lw=1.5, alpha=0.95)
+               for c in _KCL_BRANCH_COLORS]
+_BBOX_KCL_V = [dict(boxstyle='round,pad=0.3', fc=c, ec='none', alpha=0.85)
+               for c in _KCL_BRANCH_COLORS]
+
+# KCL branch direction label, indexed by sign(I) + 1
+KCL_DIRS = ('← OUT', '  0  ', '→ IN')
+
+# Canonical resistor zigzag: parameter along the body and unit-free offset
+_ZIGZAG_T = np.linspace(0.0, 1.0, 13)
+_ZIGZAG_Y = 0.045 * np.array([0, 1, -1, 1, -1, 1, -1, 1, -1, 1, -1, 1, 0], dtype=np.float64)
+
+# KVL elevation map: segment widths and colours around the loop
+# (odd segments are the battery and the three resistors)
+SEG_LENS = np.array([0.5, 1.0, 0.5, 1.5, 0.3, 1.5, 0.3, 1.5, 0.5])
+SEG_COLS = [COLORS['zero'], COLORS['source'], COLORS['zero'],
+            COLORS['r1'], COLORS['zero'],
+            COLORS['r2'], COLORS['zero'],
+            COLORS['r3'], COLORS['zero']]
+
 # ══════════════════════════════════════════════════════════════
 #  Helpers
 # ══════════════════════════════════════════════════════════════
-def styled_slider(parent, label, from_, to, default, color, resolution=0.5):
+def styled_slider(parent, label, from_, to, default, color, resolution=0.5,
+                  on_change=None, on_drag=None):
     frame = tk.Frame(parent, bg=PANEL)
     frame.pack(fill='x', padx=14, pady=2)
     var = tk.DoubleVar(value=default)
@@ -61,19 +94,52 @@ def styled_slider(parent, label, from_, to, default, color, resolution=0.5):
                        bg=PANEL, fg=FG, width=7, anchor='e')
     val_lbl.pack(side='right')
 
-    def fmt_val(*_):
-        val_lbl.config(text=f"{var.get():.1f}")
-    var.trace_add('write', fmt_val)
-
-    tk.Scale(frame, variable=var, from_=from_, to=to,
-             orient='horizontal', resolution=resolution,
-             bg=PANEL, fg=FG, highlightthickness=0,
-             troughcolor=ENTRY_BG, activebackground=color,
-             sliderrelief='flat', width=11,
-             length=SLIDER_W, showvalue=False).pack(fill='x')
+    def on_scale(v):
+        val_lbl.config(text=f"{float(v):.1f}")
+        if on_change is not None:
+            on_change(v)
+
+    scale = tk.Scale(frame, variable=var, from_=from_, to=to, command=on_scale,
+                     orient='horizontal', resolution=resolution,
+                     bg=PANEL, fg=FG, highlightthickness=0,
+                     troughcolor=ENTRY_BG, activebackground=color,
+                     sliderrelief='flat', width=11,
+                     length=SLIDER_W, showvalue=False)
+    scale.pack(fill='x')
+    if on_drag is not None:
+        scale.bind('<ButtonPress-1>', lambda e: on_drag(True), add='+')
+        scale.bind('<ButtonRelease-1>', lambda e: on_drag(False), add='+')
     return var
 
 
+def cached_slider(parent, cache, key, label, from_, to, default, color,
+                  resolution, on_change, on_drag=None):
+    """styled_slider that mirrors its value into cache[key] on every step,
+    so readers use a plain dict instead of a DoubleVar.get() Tcl round-trip."""
+    cache[key] = default
+
+    def store(v):
+        cache[key] = float(v)
+        on_change()
+    return styled_slider(parent, label, from_, to, default, color, resolution,
+                         store, on_drag)
+
+
+def elevation_path(deltas):
+    """
+    Corner points of the KVL staircase for per-segment potential steps.
+    A segment with a non-zero step contributes its vertical jump at the
+    segment start and then a flat run; a zero segment is just the run.
+    """
+    counts = 1 + (deltas != 0)
+    ends   = np.cumsum(SEG_LENS)
+    x = np.repeat(ends, counts)
+    jump = counts == 2
+    x[(np.cumsum(counts) - counts)[jump]] = (ends - SEG_LENS)[jump]
+    y = np.repeat(np.cumsum(deltas), counts)
+    return np.concatenate(([0.0], x)), np.concatenate(([0.0], y))
+
+
 def sep(parent, text, color=ACCENT):
     tk.Label(parent, text=text, font=('Consolas', 10, 'bold'),
              bg=PANEL, fg=color).pack(anchor='w', padx=12, pady=(11, 0))
@@ -96,9 +162,10 @@ def ax_style(ax, title='', xlabel='', ylabel='', title_color=FG, grid=True):
 # ══════════════════════════════════════════════════════════════
 #  Circuit Drawing Primitives
 # ══════════════════════════════════════════════════════════════
-def draw_wire(ax, x0, y0, x1, y1, color=COLORS['wire'], lw=2.5):
-    ax.plot([x0, x1], [y0, y1], color=color, linewidth=lw,
-            solid_capstyle='round', zorder=2)
+def draw_wires(ax, segments, color=COLORS['wire'], lw=2.5):
+    """Draw every ((x0, y0), (x1, y1)) segment as one LineCollection."""
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=lw,
+                                     capstyle='round', zorder=2))
 
 
 def draw_node(ax, x, y, color='#333355', r=0.04):
@@ -117,7 +184,7 @@ def draw_current_arrow(ax, x, y, dx, dy, color=COLORS['current'], label=''):
                 color=color, fontfamily='monospace', fontweight='bold')
 
 
-def draw_battery(ax, x, y, height=0.55, color=COLORS['source'], Vs=12):
+def draw_battery(ax, x, y, height=0.55, color=COLORS['source']):
     """Vertical battery: long line = +, short line = –"""
     # Body lines
     half_l = 0.22   # long (+)
@@ -140,15 +207,17 @@ def draw_battery(ax, x, y, height=0.55, color=COLORS['source'], Vs=12):
             fontweight='bold', ha='left', va='center', zorder=7)
     ax.text(x + 0.16, y - gap - 0.04, '−', fontsize=13, color=color,
             fontweight='bold', ha='left', va='center', zorder=7)
-    ax.text(x, y - height/2 - 0.18,
-            f"Vs = {Vs:.1f} V", ha='center', va='top',
-            fontsize=8.5, fontfamily='monospace', fontweight='bold',
-            color=color, zorder=7,
-            bbox=dict(boxstyle='round,pad=0.25', fc='white', ec=color, lw=1.2))
 
 
-def draw_resistor(ax, cx, cy, orientation='h', color='#333355',
-                  label='R', value=100.0, voltage=0.0):
+def battery_label(ax, x, y, height=0.55, color=COLORS['source']):
+    """Empty Vs value Text under a battery drawn by draw_battery."""
+    return ax.text(x, y - height/2 - 0.18, '', ha='center', va='top',
+                   fontsize=8.5, fontfamily='monospace', fontweight='bold',
+                   color=color, zorder=7,
+                   bbox=dict(boxstyle='round,pad=0.25', fc='white', ec=color, lw=1.2))
+
+
+def draw_resistor(ax, cx, cy, orientation='h', color='#333355'):
     """
     Draw a resistor as a rectangle with zigzag fill hint.
     orientation: 'h' = horizontal (top/bottom of loop)
@@ -164,123 +233,110 @@ def draw_resistor(ax, cx, cy, orientation='h', color='#333355',
 
     # Zigzag inside
     if orientation == 'h':
-        zx = np.linspace(cx - rw/2 + 0.04, cx + rw/2 - 0.04, 13)
-        zy = cy + 0.045 * np.array([0,1,-1,1,-1,1,-1,1,-1,1,-1,1,0])
-        ax.plot(zx, zy, color=color, linewidth=1.3, zorder=7)
+        zx = (cx - rw/2 + 0.04) + _ZIGZAG_T * (rw - 0.08)
+        zy = cy + _ZIGZAG_Y
     else:
-        zy = np.linspace(cy - rh/2 + 0.04, cy + rh/2 - 0.04, 13)
-        zx = cx + 0.045 * np.array([0,1,-1,1,-1,1,-1,1,-1,1,-1,1,0])
-        ax.plot(zx, zy, color=color, linewidth=1.3, zorder=7)
+        zy = (cy - rh/2 + 0.04) + _ZIGZAG_T * (rh - 0.08)
+        zx = cx + _ZIGZAG_Y
+    ax.plot(zx, zy, color=color, linewidth=1.3, zorder=7)
+
 
+def resistor_labels(ax, cx, cy, orientation='h', color='#333355'):
+    """Empty (value, voltage-drop) Texts beside a resistor from draw_resistor."""
     # Component label (above/below)
     lbl_offset = 0.22 if orientation == 'h' else 0.0
     lbl_x_off  = 0.0  if orientation == 'h' else 0.30
-    ax.text(cx + lbl_x_off, cy + lbl_offset,
-            f"{label}={value:.0f}Ω",
-            ha='center', va='bottom' if orientation == 'h' else 'center',
-            fontsize=8, fontfamily='monospace', fontweight='bold',
-            color=color, zorder=8)
+    value_txt = ax.text(cx + lbl_x_off, cy + lbl_offset, '',
+                        ha='center', va='bottom' if orientation == 'h' else 'center',
+                        fontsize=8, fontfamily='monospace', fontweight='bold',
+                        color=color, zorder=8)
 
     # Voltage drop label (below/right)
     v_offset = -0.22 if orientation == 'h' else 0.0
     v_x_off  = 0.0   if orientation == 'h' else -0.30
     vbg = dict(boxstyle='round,pad=0.2', fc=color, ec='none', alpha=0.85)
-    ax.text(cx + v_x_off, cy + v_offset,
-            f"−{voltage:.2f}V",
-            ha='center', va='top' if orientation == 'h' else 'center',
-            fontsize=8, fontfamily='monospace', fontweight='bold',
-            color='white', zorder=8, bbox=vbg)
-
-
-def draw_kvl_circuit(ax, Vs, R1, R2, R3, V1, V2, V3, I):
+    volt_txt = ax.text(cx + v_x_off, cy + v_offset, '',
+                       ha='center', va='top' if orientation == 'h' else 'center',
+                       fontsize=8, fontfamily='monospace', fontweight='bold',
+                       color='white', zorder=8, bbox=vbg)
+    return value_txt, volt_txt
+
+
+# ── KVL loop geometry (circuit axes data units) ────────────────
+# TL = top-left, TR = top-right, BL = bottom-left, BR = bottom-right
+TL = (0.9, 3.4)
+TR = (5.1, 3.4)
+BL = (0.9, 0.7)
+BR = (5.1, 0.7)
+# R1 and R2 sit on the top wire, R3 on the right, the battery on the left
+R1_CX  = (TL[0] + 2.9) / 2 + 0.35   # ~2.3
+R2_CX  = (2.9 + TR[0]) / 2          # ~4.0
+R3_CY  = (TR[1] + BR[1]) / 2
+BAT_CY = (TL[1] + BL[1]) / 2
+CKT_EXTENT = [0, 6, -0.5, 4.2]
+
+
+def draw_kvl_skeleton(ax):
     """
-    Draw a full series loop circuit:
+    Draw the value-independent part of the series loop:
         Top:    R1 (left) ─── R2 (right)
         Left:   Vs (battery)
         Right:  R3
         Bottom: wire
+    plus corner nodes, current arrows and the +/- terminal marks.
     """
     ax.set_facecolor('#ffffff')
-    ax.set_xlim(0, 6)
-    ax.set_ylim(-0.5, 4.2)
+    ax.set_xlim(*CKT_EXTENT[:2])
+    ax.set_ylim(*CKT_EXTENT[2:])
     ax.set_aspect('equal')
     ax.axis('off')
 
-    # ── Corner coordinates ─────────────────────────────────
-    # TL = top-left, TR = top-right, BL = bottom-left, BR = bottom-right
-    TL = (0.9, 3.4)
-    TR = (5.1, 3.4)
-    BL = (0.9, 0.7)
-    BR = (5.1, 0.7)
-
     lw = 2.8   # wire width
 
     # ── Wires ──────────────────────────────────────────────
-    # Top: TL → mid1 → mid2 → TR  (split for R1 and R2)
-    top_m1 = (2.2, 3.4)   # left of R1
-    top_m2 = (2.9, 3.4)   # right of R1 / left of R2
-    top_m3 = (3.6, 3.4)   # right of R2
-    # Actually place R1 centred at 2.55, R2 centred at 4.05
-    r1_cx = (TL[0] + top_m2[0]) / 2 + 0.35   # ~2.3
-    r2_cx = (top_m2[0] + TR[0]) / 2           # ~4.0
-
-    draw_wire(ax, TL[0], TL[1], r1_cx - 0.22, TL[1], lw=lw)          # TL→R1 left
-    draw_wire(ax, r1_cx + 0.22, TL[1], r2_cx - 0.22, TL[1], lw=lw)  # R1 right→R2 left
-    draw_wire(ax, r2_cx + 0.22, TL[1], TR[0], TL[1], lw=lw)          # R2 right→TR
-
-    # Right: TR → BR  (R3 in middle)
-    r3_cy = (TR[1] + BR[1]) / 2
-    draw_wire(ax, TR[0], TR[1], TR[0], r3_cy + 0.22, lw=lw)
-    draw_wire(ax, TR[0], r3_cy - 0.22, TR[0], BR[1], lw=lw)
-
-    # Bottom: BR → BL
-    draw_wire(ax, BR[0], BR[1], BL[0], BR[1], lw=lw)
-
-    # Left: BL → battery → TL
-    bat_cy = (TL[1] + BL[1]) / 2
-    draw_wire(ax, BL[0], BL[1], BL[0], bat_cy - 0.28, lw=lw)
-    draw_wire(ax, BL[0], bat_cy + 0.28, BL[0], TL[1], lw=lw)
+    draw_wires(ax, [
+        (TL, (R1_CX - 0.22, TL[1])),                      # TL→R1 left
+        ((R1_CX + 0.22, TL[1]), (R2_CX - 0.22, TL[1])),   # R1 right→R2 left
+        ((R2_CX + 0.22, TL[1]), (TR[0], TL[1])),          # R2 right→TR
+
+        # Right: TR → BR  (R3 in middle)
+        (TR, (TR[0], R3_CY + 0.22)),
+        ((TR[0], R3_CY - 0.22), (TR[0], BR[1])),
+
+        # Bottom: BR → BL
+        (BR, (BL[0], BR[1])),
+
+        # Left: BL → battery → TL
+        (BL, (BL[0], BAT_CY - 0.28)),
+        ((BL[0], BAT_CY + 0.28), (BL[0], TL[1])),
+    ], lw=lw)
 
     # ── Components ─────────────────────────────────────────
-    draw_battery(ax, BL[0], bat_cy, height=0.55, Vs=Vs)
-    draw_resistor(ax, r1_cx, TL[1], 'h', COLORS['r1'], 'R₁', R1, V1)
-    draw_resistor(ax, r2_cx, TL[1], 'h', COLORS['r2'], 'R₂', R2, V2)
-    draw_resistor(ax, TR[0], r3_cy,  'v', COLORS['r3'], 'R₃', R3, V3)
+    draw_battery(ax, BL[0], BAT_CY, height=0.55)
+    draw_resistor(ax, R1_CX, TL[1], 'h', COLORS['r1'])
+    draw_resistor(ax, R2_CX, TL[1], 'h', COLORS['r2'])
+    draw_resistor(ax, TR[0], R3_CY,  'v', COLORS['r3'])
 
     # ── Corner nodes ───────────────────────────────────────
     for pt in [TL, TR, BL, BR]:
         draw_node(ax, pt[0], pt[1], color='#2a2a4a', r=0.06)
 
     # ── Current arrows ─────────────────────────────────────
-    arr_col = COLORS['current']
-    i_label = f"I = {I*1000:.2f} mA"
-
     # Top: left to right
     ax.annotate('', xy=(2.0, TL[1] + 0.22), xytext=(1.4, TL[1] + 0.22),
-                arrowprops=dict(arrowstyle='->', color=arr_col, lw=2, mutation_scale=15))
-    ax.text(1.7, TL[1] + 0.34, i_label, ha='center', va='bottom',
-            fontsize=7.5, fontfamily='monospace', color=arr_col, fontweight='bold')
+                arrowprops=_ARROW_CURRENT)
 
     # Right: top to bottom
     ax.annotate('', xy=(TR[0] + 0.22, 1.8), xytext=(TR[0] + 0.22, 2.4),
-                arrowprops=dict(arrowstyle='->', color=arr_col, lw=2, mutation_scale=15))
+                arrowprops=_ARROW_CURRENT)
 
     # Bottom: right to left
     ax.annotate('', xy=(2.5, BR[1] - 0.22), xytext=(3.5, BR[1] - 0.22),
-                arrowprops=dict(arrowstyle='->', color=arr_col, lw=2, mutation_scale=15))
+                arrowprops=_ARROW_CURRENT)
 
     # Left: bottom to top (battery charges)
     ax.annotate('', xy=(BL[0] - 0.22, 1.6), xytext=(BL[0] - 0.22, 1.0),
-                arrowprops=dict(arrowstyle='->', color=arr_col, lw=2, mutation_scale=15))
-
-    # ── KVL equation overlay ────────────────────────────────
-    eq = (f"KVL:  {Vs:.1f} − {V1:.2f} − {V2:.2f} − {V3:.2f} = "
-          f"{Vs-V1-V2-V3:.4f} V  ✓")
-    ax.text(3.0, -0.22, eq, ha='center', va='top',
-            fontsize=9, fontfamily='monospace', fontweight='bold',
-            color='#2e7d32',
-            bbox=dict(boxstyle='round,pad=0.35', fc='#e8f5e9',
-                      ec='#2e7d32', lw=1.5))
+                arrowprops=_ARROW_CURRENT)
 
     # ── +/- node labels ────────────────────────────────────
     ax.text(TL[0] - 0.15, TL[1] + 0.12, '+', fontsize=11,
@@ -288,11 +344,61 @@ def draw_kvl_circuit(ax, Vs, R1, R2, R3, V1, V2, V3, I):
     ax.text(BL[0] - 0.15, BL[1] - 0.08, '−', fontsize=11,
             color=COLORS['source'], fontweight='bold', ha='right')
 
+
+@lru_cache(maxsize=None)
+def kvl_skeleton_rgba(dpi=160):
+    """Rasterize draw_kvl_skeleton once into an RGBA array spanning CKT_EXTENT."""
+    x0, x1, y0, y1 = CKT_EXTENT
+    fig = Figure(figsize=(x1 - x0, y1 - y0), dpi=dpi, facecolor='#ffffff')
+    FigureCanvasAgg(fig)
+    draw_kvl_skeleton(fig.add_axes([0, 0, 1, 1]))
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def draw_kvl_circuit(ax):
+    """
+    Show the cached circuit bitmap on ax and overlay the live value labels.
+    Returns a dict of Text handles (Vs, R1..R3, V1..V3, I, eq) for
+    update_kvl_circuit.
+    """
+    ax.set_facecolor('#ffffff')
+    ax.imshow(kvl_skeleton_rgba(), extent=CKT_EXTENT, zorder=0)
+    ax.set_xlim(*CKT_EXTENT[:2])
+    ax.set_ylim(*CKT_EXTENT[2:])
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    art = {'Vs': battery_label(ax, BL[0], BAT_CY, height=0.55)}
+    art['R1'], art['V1'] = resistor_labels(ax, R1_CX, TL[1], 'h', COLORS['r1'])
+    art['R2'], art['V2'] = resistor_labels(ax, R2_CX, TL[1], 'h', COLORS['r2'])
+    art['R3'], art['V3'] = resistor_labels(ax, TR[0], R3_CY,  'v', COLORS['r3'])
+    art['I'] = ax.text(1.7, TL[1] + 0.34, '', ha='center', va='bottom',
+                       fontsize=7.5, fontfamily='monospace', color=COLORS['current'],
+                       fontweight='bold')
+
+    # ── KVL equation overlay ────────────────────────────────
+    art['eq'] = ax.text(3.0, -0.22, '', ha='center', va='top',
+                        fontsize=9, fontfamily='monospace', fontweight='bold',
+                        color='#2e7d32', bbox=_BBOX_KVL_OK)
+
     # Title
     ax.set_title("Series Circuit — KVL Loop",
                  color=ACCENT, fontsize=10, fontfamily='monospace',
                  fontweight='bold', pad=4)
+    return art
+
 
+def update_kvl_circuit(art, Vs, R1, R2, R3, V1, V2, V3, I):
+    """Refresh the value labels returned by draw_kvl_circuit."""
+    art['Vs'].set_text(f"Vs = {Vs:.1f} V")
+    for k, lbl, R, V in (('1', 'R₁', R1, V1), ('2', 'R₂', R2, V2),
+                         ('3', 'R₃', R3, V3)):
+        art['R' + k].set_text(f"{lbl}={R:.0f}Ω")
+        art['V' + k].set_text(f"−{V:.2f}V")
+    art['I'].set_text(f"I = {I*1000:.2f} mA")
+    art['eq'].set_text(f"KVL:  {Vs:.1f} − {V1:.2f} − {V2:.2f} − {V3:.2f} = "
+                       f"{Vs-V1-V2-V3:.4f} V  ✓")
 
 # ══════════════════════════════════════════════════════════════
 #  TAB 1 — KVL
@@ -301,6 +407,12 @@ class KVLTab:
     def __init__(self, notebook):
         self.frame = tk.Frame(notebook, bg=BG)
         notebook.add(self.frame, text='  ⚡  KVL — Voltage Elevation  ')
+        self._after_id = None
+        self._last_inputs = None
+        self._visible = True
+        self._dirty = False
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_change, add='+')
+        self._dragging = False
         self._build()
 
     def _build(self):
@@ -324,16 +436,19 @@ class KVLTab:
                  justify='left').pack(anchor='w', padx=14, pady=(0, 8))
 
         sep(ctrl, "  Voltage Source", COLORS['source'])
-        self.vs = styled_slider(ctrl, "Vs  (V)", 1, 30, 12.0, COLORS['source'], 0.5)
+        self._cache = {}     # slider values mirrored from Scale commands
+        slider = partial(cached_slider, ctrl, self._cache,
+                         on_change=self._schedule_update, on_drag=self._on_drag)
+        self.vs = slider('vs', "Vs  (V)", 1, 30, 12.0, COLORS['source'], 0.5)
 
         sep(ctrl, "  Resistors (Ω)", FG)
-        self.r1 = styled_slider(ctrl, "R₁  (Ω)", 10, 500, 100.0, COLORS['r1'], 5)
-        self.r2 = styled_slider(ctrl, "R₂  (Ω)", 10, 500, 200.0, COLORS['r2'], 5)
-        self.r3 = styled_slider(ctrl, "R₃  (Ω)", 10, 500, 150.0, COLORS['r3'], 5)
+        self.r1 = slider('r1', "R₁  (Ω)", 10, 500, 100.0, COLORS['r1'], 5)
+        self.r2 = slider('r2', "R₂  (Ω)", 10, 500, 200.0, COLORS['r2'], 5)
+        self.r3 = slider('r3', "R₃  (Ω)", 10, 500, 150.0, COLORS['r3'], 5)
 
         sep(ctrl, "  Live Results", COLORS['source'])
-        self.info = tk.Text(ctrl, font=('Consolas', 9), bg=SUBPANEL,
-                            fg=FG, relief='flat', height=11, state='disabled')
+        self.info = tk.Label(ctrl, font=('Consolas', 9), bg=SUBPANEL,
+                             fg=FG, justify='left', anchor='w')
         self.info.pack(padx=12, pady=4, fill='x')
 
         tk.Label(ctrl, text="⚠  KVL Check:",
@@ -357,156 +472,258 @@ class KVLTab:
         self.fig = Figure(figsize=(10, 7.5), dpi=95, facecolor=BG)
         self.canvas = FigureCanvasTkAgg(self.fig, master=right)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
-
-        for v in (self.vs, self.r1, self.r2, self.r3):
-            v.trace_add('write', lambda *_: self._update())
+        self._build_figure()
 
         self._update()
 
-    def _update(self, *_):
-        Vs   = max(self.vs.get(), 0.01)
-        R1   = max(self.r1.get(), 1)
-        R2   = max(self.r2.get(), 1)
-        R3   = max(self.r3.get(), 1)
-        Rtot = R1 + R2 + R3
-        I    = Vs / Rtot
-        V1, V2, V3 = I*R1, I*R2, I*R3
-        check = Vs - V1 - V2 - V3
-
-        # ── Sidebar text ────────────────────────────────────
-        self.info.config(state='normal')
-        self.info.delete('1.0', 'end')
-        self.info.insert('end', '\n'.join([
-            f"  I      = {I*1000:.3f} mA",
-            f"  I      = {I:.5f} A",
-            f"",
-            f"  V₁ = I·R₁ = {V1:.4f} V",
-            f"  V₂ = I·R₂ = {V2:.4f} V",
-            f"  V₃ = I·R₃ = {V3:.4f} V",
-            f"",
-            f"  Rtotal = {Rtot:.1f} Ω",
-            f"  Power  = {I*Vs:.4f} W",
-            f"  P₁     = {I*V1:.4f} W",
-            f"  P₂     = {I*V2:.4f} W",
-            f"  P₃     = {I*V3:.4f} W",
-        ]))
-        self.info.config(state='disabled')
-
-        self.kvl_check.config(
-            text=f"  {Vs:.2f} − {V1:.3f} − {V2:.3f} − {V3:.3f} = {check:.5f} V  ✓",
-            bg='#e8f5e9', fg='#2e7d32')
-
-        # ── Figure layout ───────────────────────────────────
-        self.fig.clear()
-        self.fig.patch.set_facecolor(BG)
+    def _on_tab_change(self, event):
+        """Track whether this tab is shown; catch up on a deferred update."""
+        nb = event.widget
+        self._visible = nb.nametowidget(nb.select()) is self.frame
+        if self._visible and self._dirty:
+            self._dirty = False
+            self._update()
+
+    def _schedule_update(self, *_):
+        """Collapse a burst of slider writes into one _update (~60 Hz cap)."""
+        if self._after_id is not None:
+            self.frame.after_cancel(self._after_id)
+        self._after_id = self.frame.after(16, self._do_update)
+
+    def _do_update(self):
+        self._after_id = None
+        self._update()
 
+    def _build_figure(self):
+        """Create the axes and every artist once; _update only mutates them."""
         gs = GridSpec(2, 3, figure=self.fig,
                       hspace=0.50, wspace=0.38,
                       left=0.05, right=0.98, top=0.93, bottom=0.07)
 
         # ── [0, 0:2]  Circuit diagram ─────────────────────
-        ax_ckt = self.fig.add_subplot(gs[0, 0:2])
-        draw_kvl_circuit(ax_ckt, Vs, R1, R2, R3, V1, V2, V3, I)
+        self.ax_ckt = self.fig.add_subplot(gs[0, 0:2])
+        self._ckt = draw_kvl_circuit(self.ax_ckt)
 
         # ── [0, 2]    Voltage drop bar ────────────────────
-        ax_bar = self.fig.add_subplot(gs[0, 2])
+        ax_bar = self.ax_bar = self.fig.add_subplot(gs[0, 2])
         ax_style(ax_bar, title="Voltage Drops", ylabel="Voltage (V)",
                  title_color=FG)
         bar_labels = ['Vs', 'V₁\n(R₁)', 'V₂\n(R₂)', 'V₃\n(R₃)']
-        bar_vals   = [Vs, V1, V2, V3]
         bar_cols   = [COLORS['source'], COLORS['r1'], COLORS['r2'], COLORS['r3']]
-        bars = ax_bar.bar(bar_labels, bar_vals, color=bar_cols,
-                          edgecolor='white', linewidth=1.5, width=0.55)
-        for bar, v in zip(bars, bar_vals):
-            ax_bar.text(bar.get_x() + bar.get_width()/2,
-                        bar.get_height() + 0.18, f"{v:.2f}V",
+        self._bars = ax_bar.bar(bar_labels, [0, 0, 0, 0], color=bar_cols,
+                                edgecolor='white', linewidth=1.5, width=0.55)
+        self._bar_texts = [
+            ax_bar.text(bar.get_x() + bar.get_width()/2, 0, '',
                         ha='center', va='bottom', fontsize=8,
                         fontfamily='monospace', fontweight='bold', color=FG)
-        ax_bar.set_ylim(0, Vs * 1.30)
+            for bar in self._bars]
         ax_bar.tick_params(axis='x', labelsize=8)
 
         # ── [1, 0:2]  KVL Elevation staircase ────────────
-        ax_elev = self.fig.add_subplot(gs[1, 0:2])
+        ax_elev = self.ax_elev = self.fig.add_subplot(gs[1, 0:2])
         ax_style(ax_elev,
-                 title=f"KVL Elevation Map  —  Vs={Vs:.1f}V  I={I*1000:.2f}mA",
                  xlabel="Position around the loop →",
                  ylabel="Electrical Potential (V)",
                  title_color=COLORS['source'])
-
-        seg_lens = [0.5, 1.0, 0.5, 1.5, 0.3, 1.5, 0.3, 1.5, 0.5]
-        seg_labs = ['', 'Battery\n+Vs', '', f'R₁\n−{V1:.2f}V', '',
-                    f'R₂\n−{V2:.2f}V', '', f'R₃\n−{V3:.2f}V', '']
-        seg_cols = [COLORS['zero'], COLORS['source'], COLORS['zero'],
-                    COLORS['r1'], COLORS['zero'],
-                    COLORS['r2'], COLORS['zero'],
-                    COLORS['r3'], COLORS['zero']]
-        deltas = [0, +Vs, 0, -V1, 0, -V2, 0, -V3, 0]
-
-        x_pts, y_pts = [0.0], [0.0]
-        cur_x, cur_y = 0.0, 0.0
-        for sl, dy in zip(seg_lens, deltas):
-            if dy != 0:
-                x_pts.append(cur_x); y_pts.append(cur_y + dy)
-                cur_y += dy
-            cur_x += sl
-            x_pts.append(cur_x); y_pts.append(cur_y)
-
-        ax_elev.plot(x_pts, y_pts, color=COLORS['source'], linewidth=2.5,
-                     drawstyle='steps-post', zorder=3, solid_capstyle='round')
-        ax_elev.fill_between(x_pts, y_pts, alpha=0.08,
-                             color=COLORS['source'], step='post')
-
+        self._elev_line, = ax_elev.plot([], [], color=COLORS['source'], linewidth=2.5,
+                                        drawstyle='steps-post', zorder=3,
+                                        solid_capstyle='round')
+        # Fill is created once with a dummy path; _update swaps its vertices
+        self._elev_fill = ax_elev.fill_between([0, 1], [0, 0], step='post',
+                                               alpha=0.08, color=COLORS['source'])
+
+        self._seg_texts = []
         seg_bx = 0.0
-        for sl, lab, col in zip(seg_lens, seg_labs, seg_cols):
-            if lab:
+        for k, (sl, col) in enumerate(zip(SEG_LENS, SEG_COLS)):
+            if k % 2:
                 ax_elev.axvspan(seg_bx, seg_bx + sl, alpha=0.07,
                                 color=col, zorder=1)
-                ax_elev.text(seg_bx + sl/2, -Vs * 0.20, lab,
-                             ha='center', va='top', fontsize=7.5,
-                             color=col, fontfamily='monospace', fontweight='bold')
+                self._seg_texts.append(
+                    ax_elev.text(seg_bx + sl/2, 0, '',
+                                 ha='center', va='top', fontsize=7.5,
+                                 color=col, fontfamily='monospace', fontweight='bold'))
             seg_bx += sl
 
         ax_elev.axhline(0, color=COLORS['zero'], linewidth=1.2,
                         linestyle='--', zorder=2)
-        ax_elev.text(x_pts[-1] + 0.05, 0.3, '0 V',
+        ax_elev.text(seg_bx + 0.05, 0.3, '0 V',
                      color=COLORS['zero'], fontsize=8, fontfamily='monospace')
-        ax_elev.text(x_pts[-1] + 0.05, Vs + 0.3, f'{Vs:.1f} V',
-                     color=COLORS['source'], fontsize=8, fontfamily='monospace')
-        ax_elev.set_ylim(-Vs * 0.38, Vs * 1.38)
-        ax_elev.set_xlim(-0.1, x_pts[-1] + 0.5)
+        self._vs_text = ax_elev.text(seg_bx + 0.05, 0, '',
+                                     color=COLORS['source'], fontsize=8,
+                                     fontfamily='monospace')
+        ax_elev.set_xlim(-0.1, seg_bx + 0.5)
         ax_elev.set_xticks([])
 
         # ── [1, 2]   Resistance pie ────────────────────────
-        ax_pie = self.fig.add_subplot(gs[1, 2])
-        ax_pie.set_facecolor('#ffffff')
-        ax_pie.set_title("Resistance Split", color=FG,
-                         fontsize=9, fontfamily='monospace',
-                         fontweight='bold', pad=5)
-        wedges, texts, autos = ax_pie.pie(
-            [R1, R2, R3],
-            labels=['R₁', 'R₂', 'R₃'],
-            colors=[COLORS['r1'], COLORS['r2'], COLORS['r3']],
-            autopct=lambda p: f"{p:.1f}%\n{p*Rtot/100:.0f}Ω",
-            startangle=140,
-            textprops=dict(fontsize=8, color=FG, fontfamily='monospace'),
-            wedgeprops=dict(edgecolor='white', linewidth=2.5))
-        for at in autos:
-            at.set_fontsize(7.5); at.set_color('white'); at.set_fontweight('bold')
+        self.ax_pie = self.fig.add_subplot(gs[1, 2])
+        self.ax_pie.set_facecolor('#ffffff')
+        self.ax_pie.set_title("Resistance Split", color=FG,
+                              fontsize=9, fontfamily='monospace',
+                              fontweight='bold', pad=5)
+        # Same framing as ax.pie; wedge angles and labels are set in _update
+        self.ax_pie.set(frame_on=False, xticks=[], yticks=[],
+                        xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+        self.ax_pie.set_aspect('equal')
+        self._wedges, self._pie_labels, self._pie_pcts = [], [], []
+        for lab, col in zip(['R₁', 'R₂', 'R₃'],
+                            [COLORS['r1'], COLORS['r2'], COLORS['r3']]):
+            w = Wedge((0, 0), 1, 0, 0, facecolor=col, clip_on=False,
+                      **_PIE_WEDGEPROPS)
+            self.ax_pie.add_patch(w)
+            self._wedges.append(w)
+            self._pie_labels.append(
+                self.ax_pie.text(0, 0, lab, va='center', clip_on=False,
+                                 **_PIE_TEXTPROPS))
+            self._pie_pcts.append(
+                self.ax_pie.text(0, 0, '', ha='center', va='center',
+                                 clip_on=False, **_PIE_PCTPROPS))
 
         self.fig.suptitle(
             "Kirchhoff's Voltage Law  (KVL)  —  ∑V = 0  around any closed loop",
             color=FG, fontsize=11, fontweight='bold')
 
-        self.canvas.draw()
+        # Value-dependent artists are animated: a full draw renders only the
+        # static scaffolding, which _on_draw caches for blitting.
+        for a in self._blit_artists():
+            a.set_animated(True)
+        self._bg = None
+        self._blit_vs = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _blit_artists(self):
+        return [*self._ckt.values(), *self._bars, *self._bar_texts,
+                self.ax_elev.title, self._elev_line, *self._seg_texts,
+                self._vs_text, self._elev_fill,
+                *self._wedges, *self._pie_labels, *self._pie_pcts]
+
+    def _draw_dynamic(self):
+        for a in self._blit_artists():
+            self.fig.draw_artist(a)
+
+    def _on_draw(self, event):
+        # Also fires after a resize, so the cached background tracks the size
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_dynamic()
+
+    def _on_drag(self, active):
+        # While a slider is held, _update only blits; the full re-render
+        # (axis rescale) runs once after the button is released.
+        self._dragging = active
+        if not active:
+            self._last_inputs = None   # same values, but needs the full render
+            self.frame.after(50, self._update)
+
+    def _update(self, *_):
+        # A hidden tab only records that it is stale
+        if not self._visible:
+            self._dirty = True
+            return
+        c = self._cache
+        Vs, R1, R2, R3 = key = c['vs'], c['r1'], c['r2'], c['r3']
+        # Tk rounds to the slider resolution after dispatch, so many writes
+        # repeat the last values; nothing to redraw then
+        if key == self._last_inputs:
+            return
+        self._last_inputs = key
+        Rtot = R1 + R2 + R3
+        I    = Vs / Rtot
+        V1, V2, V3 = I*R1, I*R2, I*R3
+        check = Vs - V1 - V2 - V3
+
+        # ── Sidebar text ────────────────────────────────────
+        self.info.config(text='\n'.join([
+            f"  I      = {I*1000:.3f} mA",
+            f"  I      = {I:.5f} A",
+            f"",
+            f"  V₁ = I·R₁ = {V1:.4f} V",
+            f"  V₂ = I·R₂ = {V2:.4f} V",
+            f"  V₃ = I·R₃ = {V3:.4f} V",
+            f"",
+            f"  Rtotal = {Rtot:.1f} Ω",
+            f"  Power  = {I*Vs:.4f} W",
+            f"  P₁     = {I*V1:.4f} W",
+            f"  P₂     = {I*V2:.4f} W",
+            f"  P₃     = {I*V3:.4f} W",
+        ]))
+
+        self.kvl_check.config(
+            text=f"  {Vs:.2f} − {V1:.3f} − {V2:.3f} − {V3:.3f} = {check:.5f} V  ✓",
+            bg='#e8f5e9', fg='#2e7d32')
 
+        # ── Circuit diagram labels ──────────────────────────
+        update_kvl_circuit(self._ckt, Vs, R1, R2, R3, V1, V2, V3, I)
+
+        # ── Voltage drop bars ───────────────────────────────
+        bar_vals = [Vs, V1, V2, V3]
+        for bar, txt, v in zip(self._bars, self._bar_texts, bar_vals):
+            bar.set_height(v)
+            txt.set_y(v + 0.18)
+            txt.set_text(f"{v:.2f}V")
+        # Axis limits (and so ticks/grid in the background) follow Vs only.
+        # Mid-drag they are left alone, so the blitted artists stay on the
+        # scale of the cached background until the full render on release.
+        full = self._bg is None or (Vs != self._blit_vs and not self._dragging)
+        if full:
+            self.ax_bar.set_ylim(0, Vs * 1.30)
+
+        # ── KVL Elevation staircase ─────────────────────────
+        self.ax_elev.title.set_text(
+            f"KVL Elevation Map  —  Vs={Vs:.1f}V  I={I*1000:.2f}mA")
+        x_pts, y_pts = elevation_path(np.array([0, +Vs, 0, -V1, 0, -V2, 0, -V3, 0]))
+
+        self._elev_line.set_data(x_pts, y_pts)
+        # Closed steps-post polygon down to the 0 V baseline
+        xs = np.repeat(x_pts, 2)[1:]
+        ys = np.repeat(y_pts, 2)[:-1]
+        self._elev_fill.set_verts([np.column_stack(
+            [np.r_[x_pts[0], xs, x_pts[-1]], np.r_[0.0, ys, 0.0]])])
+
+        seg_labs = ['Battery\n+Vs', f'R₁\n−{V1:.2f}V',
+                    f'R₂\n−{V2:.2f}V', f'R₃\n−{V3:.2f}V']
+        for txt, lab in zip(self._seg_texts, seg_labs):
+            txt.set_y(-Vs * 0.20)
+            txt.set_text(lab)
+        self._vs_text.set_y(Vs + 0.3)
+        self._vs_text.set_text(f'{Vs:.1f} V')
+        if full:
+            self.ax_elev.set_ylim(-Vs * 0.38, Vs * 1.38)
+
+        # ── Resistance pie ──────────────────────────────────
+        frac = np.array([R1, R2, R3]) / Rtot
+        theta = 140 + 360 * np.concatenate([[0], np.cumsum(frac)])
+        mid = np.radians((theta[:-1] + theta[1:]) / 2)
+        for w, lab, pct, t1, t2, c, s, f in zip(
+                self._wedges, self._pie_labels, self._pie_pcts,
+                theta[:-1], theta[1:], np.cos(mid), np.sin(mid), frac):
+            w.set_theta1(t1); w.set_theta2(t2)
+            lab.set_position((1.1*c, 1.1*s))
+            lab.set_ha('right' if c < 0 else 'left')
+            pct.set_position((0.6*c, 0.6*s))
+            pct.set_text(f"{f*100:.1f}%\n{f*Rtot:.0f}Ω")
+
+        if full:
+            self._bg = None
+            self._blit_vs = Vs
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._bg)
+            self._draw_dynamic()
+            self.canvas.blit(self.fig.bbox)
 
 # ══════════════════════════════════════════════════════════════
 #  TAB 2 — KCL Fluid Junction  (unchanged)
 # ══════════════════════════════════════════════════════════════
 class KCLTab:
+    X_IN, X_OUT = 0.4, 1.6      # balance-bar column positions
+
     def __init__(self, notebook):
         self.frame = tk.Frame(notebook, bg=BG)
         notebook.add(self.frame, text='  🔵  KCL — Current Junction  ')
+        self._after_id = None
+        self._last_inputs = None
+        self._visible = True
+        self._dirty = False
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_change, add='+')
         self._build()
 
     def _build(self):
@@ -529,18 +746,21 @@ class KCLTab:
                  justify='left').pack(anchor='w', padx=14, pady=(0, 8))
 
         sep(ctrl, "  Branch Voltages (V)", COLORS['source'])
-        self.v1 = styled_slider(ctrl, "V₁  (V)", -20, 20,  12.0, COLORS['r1'], 0.5)
-        self.v2 = styled_slider(ctrl, "V₂  (V)", -20, 20,  -6.0, COLORS['r2'], 0.5)
-        self.v3 = styled_slider(ctrl, "V₃  (V)", -20, 20,   8.0, COLORS['r3'], 0.5)
+        self._cache = {}     # slider values mirrored from Scale commands
+        slider = partial(cached_slider, ctrl, self._cache,
+                         on_change=self._schedule_update)
+        self.v1 = slider('v1', "V₁  (V)", -20, 20,  12.0, COLORS['r1'], 0.5)
+        self.v2 = slider('v2', "V₂  (V)", -20, 20,  -6.0, COLORS['r2'], 0.5)
+        self.v3 = slider('v3', "V₃  (V)", -20, 20,   8.0, COLORS['r3'], 0.5)
 
         sep(ctrl, "  Branch Resistances (Ω)", FG)
-        self.r1 = styled_slider(ctrl, "R₁  (Ω)", 10, 500, 100.0, COLORS['r1'], 5)
-        self.r2 = styled_slider(ctrl, "R₂  (Ω)", 10, 500, 200.0, COLORS['r2'], 5)
-        self.r3 = styled_slider(ctrl, "R₃  (Ω)", 10, 500, 150.0, COLORS['r3'], 5)
+        self.r1 = slider('r1', "R₁  (Ω)", 10, 500, 100.0, COLORS['r1'], 5)
+        self.r2 = slider('r2', "R₂  (Ω)", 10, 500, 200.0, COLORS['r2'], 5)
+        self.r3 = slider('r3', "R₃  (Ω)", 10, 500, 150.0, COLORS['r3'], 5)
 
         sep(ctrl, "  Live Results", COLORS['source'])
-        self.info = tk.Text(ctrl, font=('Consolas', 9), bg=SUBPANEL,
-                            fg=FG, relief='flat', height=10, state='disabled')
+        self.info = tk.Label(ctrl, font=('Consolas', 9), bg=SUBPANEL,
+                             fg=FG, justify='left', anchor='w')
         self.info.pack(padx=12, pady=4, fill='x')
 
         self.kcl_check = tk.Label(ctrl,
@@ -553,32 +773,140 @@ class KCLTab:
         self.canvas = FigureCanvasTkAgg(self.fig, master=right)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
-        for v in (self.v1, self.v2, self.v3, self.r1, self.r2, self.r3):
-            v.trace_add('write', lambda *_: self._update())
+        gs = GridSpec(1, 2, figure=self.fig,
+                      left=0.04, right=0.97, top=0.90, bottom=0.06, wspace=0.25)
+        self.ax_node = self.fig.add_subplot(gs[0, 0])
+        self.ax_bal  = self.fig.add_subplot(gs[0, 1])
+        self.fig.suptitle(
+            "Kirchhoff's Current Law  (KCL)  —  ∑I_in = ∑I_out  at every node",
+            color=FG, fontsize=11, fontweight='bold')
+        self._build_node()
+        self._build_balance()
 
         self._update()
 
+    def _build_node(self):
+        """Junction diagram: branches, arrows and labels are created once."""
+        ax = self.ax_node
+        ax.set_facecolor('#ffffff')
+        ax.set_xlim(-2.8, 2.8); ax.set_ylim(-2.8, 2.8)
+        ax.set_aspect('equal'); ax.axis('off')
+        ax.set_title("KCL Node Junction Diagram",
+                     color=ACCENT, fontsize=10, fontfamily='monospace',
+                     fontweight='bold', pad=6)
+
+        self._branches = []
+        for ang, col, rbox, vbox in zip([90, 210, 330], _KCL_BRANCH_COLORS,
+                                        _BBOX_KCL_R, _BBOX_KCL_V):
+            rad = np.radians(ang)
+            c, s = np.cos(rad), np.sin(rad)
+            ex = 2.3 * c; ey = 2.3 * s
+            line, = ax.plot([0, ex], [0, ey], color=col, alpha=0.85,
+                            solid_capstyle='round', zorder=2)
+            arrow = FancyArrowPatch((ex, ey), (ex, ey), arrowstyle='->',
+                                    mutation_scale=22, zorder=3)
+            ax.add_patch(arrow)
+            r_txt = ax.text(ex*0.60, ey*0.60, '',
+                            ha='center', va='center', fontsize=7.5,
+                            fontfamily='monospace', fontweight='bold', color=col,
+                            bbox=rbox, zorder=5)
+            v_txt = ax.text(ex*1.05, ey*1.05, '',
+                            ha='center', va='center', fontsize=8,
+                            fontfamily='monospace', fontweight='bold', color='white',
+                            bbox=vbox, zorder=5)
+            self._branches.append((c, s, line, arrow, r_txt, v_txt))
+
+        nc = Circle((0,0), 0.22, color=COLORS['node'], zorder=10,
+                    linewidth=2, ec='white')
+        ax.add_patch(nc)
+        self._vn_text = ax.text(0, -0.5, '', ha='center', va='top',
+                                fontsize=8, fontfamily='monospace', fontweight='bold',
+                                color=COLORS['node'], bbox=_BBOX_VN)
+        ax.legend(handles=[
+            mpatches.Patch(color=COLORS['kcl_in'],  label='Current IN'),
+            mpatches.Patch(color=COLORS['kcl_out'], label='Current OUT')],
+            loc='lower right', fontsize=8, framealpha=0.85,
+            prop=_LEGEND_PROP)
+
+    def _build_balance(self):
+        """Pre-create the stacked IN/OUT bars and labels; _update mutates them."""
+        ax2 = self.ax_bal
+        ax_style(ax2, title="KCL Balance — ∑I_in = ∑I_out",
+                 ylabel="Current  (A)", title_color=ACCENT)
+
+        r_cols = [COLORS['r1'], COLORS['r2'], COLORS['r3']]
+        self._in_bars = ax2.bar([self.X_IN] * 3, [0, 0, 0], color=r_cols, width=0.55,
+                                edgecolor='white', linewidth=1.2, alpha=0.88)
+        self._out_bars = ax2.bar([self.X_OUT] * 3, [0, 0, 0], color=r_cols, width=0.55,
+                                 edgecolor='white', linewidth=1.2, alpha=0.55,
+                                 hatch='////')
+        self._in_texts = [
+            ax2.text(self.X_IN, 0, '', ha='center', va='center', fontsize=8,
+                     fontfamily='monospace', fontweight='bold', color='white')
+            for _ in r_cols]
+        self._out_texts = [
+            ax2.text(self.X_OUT, 0, '', ha='center', va='center', fontsize=8,
+                     fontfamily='monospace', fontweight='bold', color=col)
+            for col in r_cols]
+
+        ax2.set_xlim(0, 2)
+        ax2.set_xticks([self.X_IN, self.X_OUT])
+        self._bal_line = ax2.axhline(0, color=ACCENT2,
+                                     linewidth=2, linestyle='--', alpha=0.7)
+        self._bal_text = ax2.text(1.0, 0, '', ha='center', fontsize=9,
+                                  fontfamily='monospace', fontweight='bold')
+        self._bal_arrow = ax2.annotate('',
+                                       xy=(self.X_OUT - 0.3, 0),
+                                       xytext=(self.X_IN + 0.3, 0),
+                                       arrowprops=dict(arrowstyle='<->', color=ACCENT,
+                                                       lw=2, mutation_scale=18))
+        self._bal_eq = ax2.text(1.0, 0, "=", ha='center', va='bottom', fontsize=18,
+                                color=ACCENT, fontweight='bold')
+
+    def _on_tab_change(self, event):
+        """Track whether this tab is shown; catch up on a deferred update."""
+        nb = event.widget
+        self._visible = nb.nametowidget(nb.select()) is self.frame
+        if self._visible and self._dirty:
+            self._dirty = False
+            self._update()
+
+    def _schedule_update(self, *_):
+        """Collapse a burst of slider writes into one _update (~60 Hz cap)."""
+        if self._after_id is not None:
+            self.frame.after_cancel(self._after_id)
+        self._after_id = self.frame.after(16, self._do_update)
+
+    def _do_update(self):
+        self._after_id = None
+        self._update()
+
     def _update(self, *_):
-        V1 = self.v1.get(); V2 = self.v2.get(); V3 = self.v3.get()
-        R1 = max(self.r1.get(), 1)
-        R2 = max(self.r2.get(), 1)
-        R3 = max(self.r3.get(), 1)
-
-        G1, G2, G3 = 1/R1, 1/R2, 1/R3
-        Vn = (G1*V1 + G2*V2 + G3*V3) / (G1 + G2 + G3)
-        I1 = (V1 - Vn) / R1
-        I2 = (V2 - Vn) / R2
-        I3 = (V3 - Vn) / R3
-
-        currents = [I1, I2, I3]
-        I_in  = sum(i for i in currents if i > 0)
-        I_out = sum(abs(i) for i in currents if i < 0)
+        # A hidden tab only records that it is stale
+        if not self._visible:
+            self._dirty = True
+            return
+        c = self._cache
+        key = (c['v1'], c['v2'], c['v3'], c['r1'], c['r2'], c['r3'])
+        if key == self._last_inputs:
+            return
+        self._last_inputs = key
+        V = np.array([c['v1'], c['v2'], c['v3']])
+        R = np.array([c['r1'], c['r2'], c['r3']])
+
+        G  = 1.0 / R
+        Vn = (G @ V) / G.sum()
+        I  = (V - Vn) / R
+
+        in_vals  = np.maximum(I, 0.0)
+        out_vals = np.maximum(-I, 0.0)
+        I_in, I_out = in_vals.sum(), out_vals.sum()
         check = I_in - I_out
 
-        self.info.config(state='normal')
-        self.info.delete('1.0', 'end')
-        dirs = ['→ IN' if i > 0 else '← OUT' if i < 0 else '  0  ' for i in currents]
-        self.info.insert('end', '\n'.join([
+        I1, I2, I3 = I
+
+        dirs = [KCL_DIRS[int(s) + 1] for s in np.sign(I)]
+        self.info.config(text='\n'.join([
             f"  Node Vn = {Vn:.4f} V",
             f"",
             f"  I₁ = {I1:+.4f} A  {dirs[0]}",
@@ -588,140 +916,76 @@ class KCLTab:
             f"  ΣI_in  = {I_in:.4f} A",
             f"  ΣI_out = {I_out:.4f} A",
         ]))
-        self.info.config(state='disabled')
         self.kcl_check.config(
             text=f"  ΣI_in − ΣI_out = {check:+.6f} A  ✓",
             bg='#e8f5e9', fg='#2e7d32')
 
-        self.fig.clear()
-        self.fig.patch.set_facecolor(BG)
-        gs = GridSpec(1, 2, figure=self.fig,
-                      left=0.04, right=0.97, top=0.90, bottom=0.06, wspace=0.25)
-
         # ── Junction diagram ─────────────────────────────────
-        ax = self.fig.add_subplot(gs[0, 0])
-        ax.set_facecolor('#ffffff')
-        ax.set_xlim(-2.8, 2.8); ax.set_ylim(-2.8, 2.8)
-        ax.set_aspect('equal'); ax.axis('off')
-        ax.set_title("KCL Node Junction Diagram",
-                     color=ACCENT, fontsize=10, fontfamily='monospace',
-                     fontweight='bold', pad=6)
-
-        angles = [90, 210, 330]
-        branch_colors = [COLORS['r1'], COLORS['r2'], COLORS['r3']]
-        bVs = [V1, V2, V3]
-        bIs = [I1, I2, I3]
-        bRs = [R1, R2, R3]
-        bLs = ['1', '2', '3']
-
-        for ang, col, Vi, Ii, Ri, bl in zip(angles, branch_colors, bVs, bIs, bRs, bLs):
-            rad = np.radians(ang)
-            ex = 2.3 * np.cos(rad); ey = 2.3 * np.sin(rad)
-            ax.plot([0, ex], [0, ey], color=col,
-                    linewidth=max(1.5, abs(Ii)*80), alpha=0.85,
-                    solid_capstyle='round', zorder=2)
-
-            if abs(Ii) > 1e-6:
+        for (c, s, line, arrow, r_txt, v_txt), Vi, Ii, Ri, bl in zip(
+                self._branches, V, I, R, '123'):
+            ex = 2.3 * c; ey = 2.3 * s
+            line.set_linewidth(max(1.5, abs(Ii)*80))
+
+            shown = abs(Ii) > 1e-6
+            arrow.set_visible(shown)
+            if shown:
                 asc = 0.55
                 if Ii > 0:
-                    dx = -np.cos(rad)*asc; dy = -np.sin(rad)*asc
+                    dx = -c*asc; dy = -s*asc
                     ax_p, ay_p = ex, ey
                 else:
-                    dx = np.cos(rad)*asc; dy = np.sin(rad)*asc
-                    ax_p = ex - np.cos(rad)*asc*0.3
-                    ay_p = ey - np.sin(rad)*asc*0.3
-                arr_col = COLORS['kcl_in'] if Ii > 0 else COLORS['kcl_out']
-                ax.annotate('', xy=(ax_p+dx*0.6, ay_p+dy*0.6),
-                            xytext=(ax_p, ay_p),
-                            arrowprops=dict(arrowstyle='->',color=arr_col,
-                                            lw=2.5+abs(Ii)*40,mutation_scale=22))
-
-            mx = ex*0.60; my = ey*0.60
-            ax.text(mx, my, f"R{bl}={Ri:.0f}Ω\n{abs(Ii)*1000:.1f}mA",
-                    ha='center', va='center', fontsize=7.5,
-                    fontfamily='monospace', fontweight='bold', color=col,
-                    bbox=dict(boxstyle='round,pad=0.35', fc=SUBPANEL,
-                              ec=col, lw=1.5, alpha=0.95), zorder=5)
-            ax.text(ex*1.05, ey*1.05, f"V={Vi:.1f}V",
-                    ha='center', va='center', fontsize=8,
-                    fontfamily='monospace', fontweight='bold', color='white',
-                    bbox=dict(boxstyle='round,pad=0.3', fc=col, ec='none',
-                              alpha=0.85), zorder=5)
+                    dx = c*asc; dy = s*asc
+                    ax_p = ex - c*asc*0.3
+                    ay_p = ey - s*asc*0.3
+                arrow.set_positions((ax_p, ay_p), (ax_p+dx*0.6, ay_p+dy*0.6))
+                arrow.set_color(COLORS['kcl_in'] if Ii > 0 else COLORS['kcl_out'])
+                arrow.set_linewidth(2.5+abs(Ii)*40)
 
-        nc = Circle((0,0), 0.22, color=COLORS['node'], zorder=10,
-                    linewidth=2, ec='white')
-        ax.add_patch(nc)
-        ax.text(0, -0.5, f"Vn={Vn:.2f}V", ha='center', va='top',
-                fontsize=8, fontfamily='monospace', fontweight='bold',
-                color=COLORS['node'],
-                bbox=dict(boxstyle='round,pad=0.25', fc='white',
-                          ec=COLORS['node'], lw=1.2))
-        ax.legend(handles=[
-            mpatches.Patch(color=COLORS['kcl_in'],  label='Current IN'),
-            mpatches.Patch(color=COLORS['kcl_out'], label='Current OUT')],
-            loc='lower right', fontsize=8, framealpha=0.85,
-            prop={'family':'monospace','size':8})
+            r_txt.set_text(f"R{bl}={Ri:.0f}Ω\n{abs(Ii)*1000:.1f}mA")
+            v_txt.set_text(f"V={Vi:.1f}V")
+
+        self._vn_text.set_text(f"Vn={Vn:.2f}V")
 
         # ── Balance bar ──────────────────────────────────────
-        ax2 = self.fig.add_subplot(gs[0, 1])
-        ax_style(ax2, title="KCL Balance — ∑I_in = ∑I_out",
-                 ylabel="Current  (A)", title_color=ACCENT)
+        ax2 = self.ax_bal
+        bottom_in  = self._stack_bars(self._in_bars, self._in_texts, in_vals)
+        bottom_out = self._stack_bars(self._out_bars, self._out_texts, out_vals)
+        top = max(bottom_in, bottom_out)
 
-        i_vals = [I1, I2, I3]
-        r_cols = [COLORS['r1'], COLORS['r2'], COLORS['r3']]
-        r_labs = ['I₁', 'I₂', 'I₃']
-        in_vals  = [max(i,0) for i in i_vals]
-        out_vals = [abs(min(i,0)) for i in i_vals]
-        x_in, x_out = 0.4, 1.6
-
-        bottom_in = 0.0
-        for v, col, lab in zip(in_vals, r_cols, r_labs):
-            if v > 1e-9:
-                ax2.bar(x_in, v, bottom=bottom_in, color=col, width=0.55,
-                        edgecolor='white', linewidth=1.2, alpha=0.88)
-                ax2.text(x_in, bottom_in + v/2, f"{lab}\n{v*1000:.1f}mA",
-                         ha='center', va='center', fontsize=8,
-                         fontfamily='monospace', fontweight='bold', color='white')
-                bottom_in += v
-
-        bottom_out = 0.0
-        for v, col, lab in zip(out_vals, r_cols, r_labs):
-            if v > 1e-9:
-                ax2.bar(x_out, v, bottom=bottom_out, color=col, width=0.55,
-                        edgecolor='white', linewidth=1.2, alpha=0.55, hatch='////')
-                ax2.text(x_out, bottom_out + v/2, f"{lab}\n{v*1000:.1f}mA",
-                         ha='center', va='center', fontsize=8,
-                         fontfamily='monospace', fontweight='bold', color=col)
-                bottom_out += v
-
-        max_val = max(bottom_in, bottom_out, 0.001)
+        max_val = max(top, 0.001)
         ax2.set_ylim(0, max_val * 1.35)
-        ax2.set_xlim(0, 2)
-        ax2.set_xticks([x_in, x_out])
         ax2.set_xticklabels([f"IN\n{I_in*1000:.2f}mA",
                               f"OUT\n{I_out*1000:.2f}mA"],
                              fontsize=9, fontfamily='monospace', fontweight='bold')
-        ax2.axhline(max(bottom_in, bottom_out), color=ACCENT2,
-                    linewidth=2, linestyle='--', alpha=0.7)
-        ax2.text(1.0, max_val*1.22,
-                 "⚖  BALANCED  ⚖" if abs(check) < 1e-9 else f"Δ={check:.5f}A",
-                 ha='center', fontsize=9, fontfamily='monospace', fontweight='bold',
-                 color='#2e7d32' if abs(check) < 1e-6 else '#c62828')
-        if max(bottom_in, bottom_out) > 1e-9:
-            ax2.annotate('',
-                         xy=(x_out-0.3, max(bottom_in, bottom_out)*0.5),
-                         xytext=(x_in+0.3, max(bottom_in, bottom_out)*0.5),
-                         arrowprops=dict(arrowstyle='<->', color=ACCENT,
-                                         lw=2, mutation_scale=18))
-            ax2.text(1.0, max(bottom_in, bottom_out)*0.5 + max_val*0.04,
-                     "=", ha='center', va='bottom', fontsize=18,
-                     color=ACCENT, fontweight='bold')
-
-        self.fig.suptitle(
-            "Kirchhoff's Current Law  (KCL)  —  ∑I_in = ∑I_out  at every node",
-            color=FG, fontsize=11, fontweight='bold')
-        self.canvas.draw()
-
+        self._bal_line.set_ydata([top, top])
+        self._bal_text.set_y(max_val*1.22)
+        self._bal_text.set_text(
+            "⚖  BALANCED  ⚖" if abs(check) < 1e-9 else f"Δ={check:.5f}A")
+        self._bal_text.set_color('#2e7d32' if abs(check) < 1e-6 else '#c62828')
+        shown = top > 1e-9
+        self._bal_arrow.set_visible(shown)
+        self._bal_eq.set_visible(shown)
+        if shown:
+            self._bal_arrow.xy = (self.X_OUT - 0.3, top*0.5)
+            self._bal_arrow.set_position((self.X_IN + 0.3, top*0.5))
+            self._bal_eq.set_y(top*0.5 + max_val*0.04)
+
+        self.canvas.draw_idle()
+
+    def _stack_bars(self, bars, texts, vals):
+        """Stack the non-zero branch currents in one column; returns its top."""
+        bottom = 0.0
+        for bar, txt, v, lab in zip(bars, texts, vals, ('I₁', 'I₂', 'I₃')):
+            shown = v > 1e-9
+            bar.set_visible(shown)
+            txt.set_visible(shown)
+            if shown:
+                bar.set_y(bottom)
+                bar.set_height(v)
+                txt.set_y(bottom + v/2)
+                txt.set_text(f"{lab}\n{v*1000:.1f}mA")
+                bottom += v
+        return bottom
 
 # ══════════════════════════════════════════════════════════════
 #  Main App
@@ -1,8 +1,19 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+import matplotlib.lines as mlines
+from matplotlib.collections import LineCollection
 from matplotlib.widgets import Button
 import tkinter as tk
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+except ImportError:                      # numba is optional
+    prange = range
+    def njit(*args, **kwargs):
+        return lambda f: f
 
 # ══════════════════════════════════════════════════════════════
 #  DATA
@@ -29,11 +40,47 @@ VECTOR_DATA = {
     "Current Density J":  {"x": 1.0,  "y": -3.5, "unit": "A/m2",  "symbol": "J"},
     "Flux Density D":     {"x": -1.5, "y": -2.5, "unit": "C/m2",  "symbol": "D"},
 }
+# Structure-of-arrays view of VECTOR_DATA; from here on VXY/VMAG hold the
+# live components and magnitudes (VMAG[i] is refreshed when VXY[i] changes)
+VNAMES = list(VECTOR_DATA)
+VIDX   = {name: i for i, name in enumerate(VNAMES)}
+VXY    = np.array([[d["x"], d["y"]] for d in VECTOR_DATA.values()], dtype=np.float64)
+VSYM   = [d["symbol"] for d in VECTOR_DATA.values()]
+VUNIT  = [d["unit"] for d in VECTOR_DATA.values()]
+VMAG   = np.hypot(VXY[:, 0], VXY[:, 1])
+E_IDX  = VIDX["Electric Field E"]
+# Row index of each scalar (table striping, listbox selection)
+SIDX   = {name: i for i, name in enumerate(SCALAR_DATA)}
 VEC_COLORS = ["#e63946","#2a9d8f","#e9c46a","#f4a261","#264653",
                "#8338ec","#3a86ff","#fb5607","#06d6a0"]
+# Popup info lines, filled straight from a SCALAR_DATA / VECTOR_DATA entry
+SCALAR_INFO = "Range: {range[0]} to {range[1]}  {unit}  |  Symbol: {symbol}"
+VECTOR_INFO = "Unit: {unit}  |  Symbol: {symbol}  |  Range: -6 to 6"
+
+# ══════════════════════════════════════════════════════════════
+#  Q × E  KERNELS
+# ══════════════════════════════════════════════════════════════
+@njit(cache=True, fastmath=True)
+def qxE_kernel(Q, Ex, Ey):
+    """Force on charge Q in field E: (Q_norm, Fx, Fy, |F|, angle of E in deg)."""
+    Qn = Q / 20.0          # [-100,100] µC  →  [-5,5] display
+    Fx = Qn * Ex; Fy = Qn * Ey
+    return Qn, Fx, Fy, np.hypot(Fx, Fy), np.degrees(np.arctan2(Ey, Ex))
+
+@njit(cache=True, parallel=True)
+def qxE_sweep(Q, Ex, Ey):
+    """qxE_kernel over an array of charges; rows of (Fx, Fy, |F|)."""
+    out = np.empty((Q.shape[0], 3))
+    for i in prange(Q.shape[0]):
+        Qn = Q[i] / 20.0
+        out[i, 0] = Qn * Ex; out[i, 1] = Qn * Ey
+        out[i, 2] = np.hypot(out[i, 0], out[i, 1])
+    return out
+
+qxE_kernel(0.0, 0.0, 0.0)   # compile (or load from cache) before the first redraw
 
 active_scalar = "Charge"
-active_vector = "Electric Field E"
+active_vector = E_IDX          # index into VNAMES / VXY
 scalar_table_visible = True
 vector_table_visible = True
 
@@ -56,38 +103,87 @@ ax_qxe_txt = fig.add_axes([0.51, 0.04, 0.14, 0.33])  # Q×E explanation card (RI
 ax_vtbl    = fig.add_axes([0.68, 0.04, 0.30, 0.88])  # vector table
 
 
+# Parsed BoxStyle per spec string, shared by every patch that uses it
+@lru_cache(maxsize=None)
+def _boxstyle(spec):
+    return mpatches.BoxStyle(spec)
+
+
+# Panels whose changing artists are animated: tag -> (axes, artists in draw
+# order). Every full draw (including after a resize) caches each panel's
+# background; edits that touch only these panels are blitted over it.
+_OVERLAYS = {}
+_overlay_bg = {}
+
+def _on_overlay_draw(event):
+    for tag, (ax, arts) in _OVERLAYS.items():
+        _overlay_bg[tag] = fig.canvas.copy_from_bbox(ax.bbox)
+        for a in arts:
+            ax.draw_artist(a)
+
+fig.canvas.mpl_connect('draw_event', _on_overlay_draw)
+
+def redraw_overlays(tags):
+    for tag in tags:
+        ax, arts = _OVERLAYS[tag]
+        fig.canvas.restore_region(_overlay_bg[tag])
+        for a in arts:
+            ax.draw_artist(a)
+        fig.canvas.blit(ax.bbox)
+
+
 # ══════════════════════════════════════════════════════════════
 #  DRAW  —  Scalar number line
 # ══════════════════════════════════════════════════════════════
-def draw_scalar_line():
-    ax = ax_snum; ax.cla(); ax.set_facecolor('white')
-    ds = SCALAR_DATA[active_scalar]
-    v = ds["value"]; lo, hi = ds["range"]
-    ax.set_title("Scalar  :  " + active_scalar, fontsize=11,
-                 fontweight='bold', pad=8, color='#b35c00')
-    ax.set_xlim(lo - (hi-lo)*0.1, hi + (hi-lo)*0.1)
+_sline = {}                         # number-line artists, built on first draw
+_TICK_Y = np.array([-0.18, 0.18])   # minor tick extent around the axis line
+
+def _build_scalar_line():
+    ax = ax_snum; ax.set_facecolor('white')
     ax.set_ylim(-1.4, 1.4)
     ax.axhline(0, color='#cccccc', linewidth=2.5); ax.set_yticks([])
     ax.tick_params(axis='x', labelsize=8)
     for sp in ['top','right','left']: ax.spines[sp].set_visible(False)
-    step = (hi-lo)/8
-    for t in np.arange(lo, hi+step, step):
-        ax.plot([t,t], [-0.18, 0.18], color='#dddddd', linewidth=1)
-    ax.plot([v], [0], 'o', color='#e07b00', markersize=20,
-            markeredgecolor='white', markeredgewidth=2.5, zorder=5)
-    ax.text(v, 0.45, ds["symbol"]+" = "+str(v)+" "+ds["unit"],
+    _sline['ticks'] = ax.add_collection(LineCollection([], colors='#dddddd', linewidths=1))
+    _sline['dot'], = ax.plot([], [], 'o', color='#e07b00', markersize=20,
+                             markeredgecolor='white', markeredgewidth=2.5, zorder=5)
+    _sline['value'] = ax.text(0, 0.45, '',
             ha='center', fontsize=11, fontweight='bold', color='#e07b00')
-    ax.text((lo+hi)/2, -0.85, 'Magnitude only  —  no direction',
+    _sline['caption'] = ax.text(0, -0.85, 'Magnitude only  —  no direction',
             ha='center', fontsize=9, color='#999999', style='italic')
-    ax.text(lo+(hi-lo)*0.01, 1.15, 'Click [Enter Scalar] to select & change',
+    _sline['hint'] = ax.text(0, 1.15, 'Click [Enter Scalar] to select & change',
             fontsize=7.5, color='#bbbbbb')
 
 
+def draw_scalar_line():
+    if not _sline:
+        _build_scalar_line()
+    ax = ax_snum
+    ds = SCALAR_DATA[active_scalar]
+    v = ds["value"]; lo, hi = ds["range"]
+    ax.set_title(f"Scalar  :  {active_scalar}", fontsize=11,
+                 fontweight='bold', pad=8, color='#b35c00')
+    ax.set_xlim(lo - (hi-lo)*0.1, hi + (hi-lo)*0.1)
+    # (9, 2, 2) array of vertical tick segments
+    ticks = np.linspace(lo, hi, 9)
+    _sline['ticks'].set_segments(np.stack(np.broadcast_arrays(ticks[:, None], _TICK_Y), axis=-1))
+    _sline['dot'].set_data([v], [0])
+    _sline['value'].set_x(v)
+    _sline['value'].set_text(f"{ds['symbol']} = {v} {ds['unit']}")
+    _sline['caption'].set_x((lo+hi)/2)
+    _sline['hint'].set_x(lo+(hi-lo)*0.01)
+
+
 # ══════════════════════════════════════════════════════════════
 #  DRAW  —  Vector grid
 # ══════════════════════════════════════════════════════════════
-def draw_vector_grid():
-    ax = ax_vec; ax.cla(); ax.set_facecolor('white')
+_vec_artists = {}   # vector name -> (arrow, marker, label), built on first draw
+_vec_info = None    # readout box for the active vector
+_vec_order = []     # all of the above, animated, re-sorted by zorder per draw
+
+def _build_vector_grid():
+    global _vec_info
+    ax = ax_vec; ax.set_facecolor('white')
     ax.set_xlim(-6,6); ax.set_ylim(-6,6); ax.set_aspect('equal')
     ax.set_title('Vector  —  All Quantities  (active highlighted)',
                  fontsize=11, fontweight='bold', pad=8, color='#0d3b8e')
@@ -98,48 +194,71 @@ def draw_vector_grid():
     ax.spines['bottom'].set_position('zero')
     ax.spines['top'].set_visible(False); ax.spines['right'].set_visible(False)
 
-    for i, (name, dv) in enumerate(VECTOR_DATA.items()):
-        vx=dv["x"]; vy=dv["y"]; col=VEC_COLORS[i]; is_a=(name==active_vector)
-        lw=3.0 if is_a else 1.2; alp=1.0 if is_a else 0.35; zo=10 if is_a else 3
-        ax.annotate('', xy=(vx,vy), xytext=(0,0),
-                    arrowprops=dict(arrowstyle='->', color=col, lw=lw,
-                                    mutation_scale=18 if is_a else 12, alpha=alp), zorder=zo)
-        ax.plot([vx],[vy], 'o', color=col, markersize=7 if is_a else 4, alpha=alp, zorder=zo+1)
-        ax.text(vx+0.2, vy+0.2, dv["symbol"],
-                fontsize=9 if is_a else 7, color=col,
-                fontweight='bold' if is_a else 'normal',
-                alpha=1.0 if is_a else 0.5)
-
-    dav = VECTOR_DATA[active_vector]
-    vx=dav["x"]; vy=dav["y"]; mag=np.sqrt(vx**2+vy**2)
-    col = VEC_COLORS[list(VECTOR_DATA.keys()).index(active_vector)]
-    ax.text(-5.8, 5.5,
-            active_vector+"\nv = ["+str(round(vx,2))+",  "+str(round(vy,2))+"]  "+dav["unit"]+
-            "\n|v| = "+str(round(mag,3)),
-            fontsize=8.5, color=col, fontweight='bold',
-            bbox=dict(boxstyle='round,pad=0.4', facecolor='#f8f9ff',
-                      edgecolor=col, alpha=0.95), zorder=15)
+    for i, name in enumerate(VNAMES):
+        col = VEC_COLORS[i]
+        arrow = mpatches.FancyArrowPatch((0,0), (0,0), arrowstyle='->', color=col)
+        ax.add_patch(arrow)
+        marker, = ax.plot([], [], 'o', color=col)
+        label = ax.text(0, 0, VSYM[i], color=col, clip_on=True)
+        _vec_artists[name] = (arrow, marker, label)
+
+    # hangs down from the top edge and is clipped like the labels, so the
+    # blitted overlay never paints outside ax_vec
+    _vec_info = ax.text(-5.8, 5.8, '', fontsize=8.5, fontweight='bold', va='top',
+                        clip_on=True,
+                        bbox=dict(boxstyle='round,pad=0.4', facecolor='#f8f9ff',
+                                  alpha=0.95), zorder=15)
+    _vec_order.extend([a for arts in _vec_artists.values() for a in arts] + [_vec_info])
+    for a in _vec_order:
+        a.set_animated(True)
+    _OVERLAYS['VGRID'] = (ax, _vec_order)
     ax.text(-5.8,-5.8, 'Click [Enter Vector] to select & change',
             fontsize=7.5, color='#bbbbbb')
 
 
+def draw_vector_grid():
+    if not _vec_artists:
+        _build_vector_grid()
+
+    for i, name in enumerate(VNAMES):
+        arrow, marker, label = _vec_artists[name]
+        vx, vy = VXY[i]; is_a=(i==active_vector)
+        alp=1.0 if is_a else 0.35; zo=10 if is_a else 3
+        arrow.set_positions((0,0), (vx,vy))
+        arrow.set_linewidth(3.0 if is_a else 1.2)
+        arrow.set_mutation_scale(18 if is_a else 12)
+        arrow.set_alpha(alp); arrow.set_zorder(zo)
+        marker.set_data([vx], [vy])
+        marker.set_markersize(7 if is_a else 4)
+        marker.set_alpha(alp); marker.set_zorder(zo+1)
+        label.set_position((vx+0.2, vy+0.2))
+        label.set_fontsize(9 if is_a else 7)
+        label.set_fontweight('bold' if is_a else 'normal')
+        label.set_alpha(1.0 if is_a else 0.5)
+
+    vx, vy = VXY[active_vector]; mag = VMAG[active_vector]
+    col = VEC_COLORS[active_vector]
+    _vec_info.set_text(
+        f"{VNAMES[active_vector]}\nv = [{vx:.2f},  {vy:.2f}]  {VUNIT[active_vector]}"
+        f"\n|v| = {mag:.3f}")
+    _vec_info.set_color(col)
+    _vec_info.get_bbox_patch().set_edgecolor(col)
+    _vec_order.sort(key=lambda a: a.get_zorder())   # the active vector moves on top
+
+
 # ══════════════════════════════════════════════════════════════
 #  DRAW  —  Q × E  LEFT: clean arrow diagram
 # ══════════════════════════════════════════════════════════════
-def draw_qxE():
+# Grid, spines, title and legend are drawn once; the arrows, markers and
+# labels are animated and blitted over the cached background.
+_qxe = {}
+_qxe_order = []     # _qxe values in zorder, fixed once built
+QXE_LIM = 5.5
+
+def _build_qxE():
     ax = ax_qxe
-    ax.cla()
     ax.set_facecolor('#ffffff')
-
-    Q_val  = SCALAR_DATA["Charge"]["value"]
-    E_data = VECTOR_DATA["Electric Field E"]
-    Ex, Ey = E_data["x"], E_data["y"]
-    E_mag  = np.sqrt(Ex**2 + Ey**2)
-    Q_norm = Q_val / 20.0          # [-100,100] µC  →  [-5,5] display
-    Fx, Fy = Q_norm * Ex, Q_norm * Ey
-    F_mag  = np.sqrt(Fx**2 + Fy**2)
-
-    LIM = 5.5
+    LIM = QXE_LIM
     ax.set_xlim(-LIM, LIM); ax.set_ylim(-LIM, LIM)
     ax.set_aspect('equal')
     ax.spines['left'].set_position('zero');   ax.spines['bottom'].set_position('zero')
@@ -153,91 +272,124 @@ def draw_qxE():
                  color='#3d1a6e', pad=6)
 
     # ── →E arrow (blue dashed) ──────────────────────
-    ax.annotate('', xy=(Ex, Ey), xytext=(0, 0),
-                arrowprops=dict(arrowstyle='-|>', color='#2980b9', lw=2.2,
-                                linestyle='dashed', mutation_scale=14), zorder=6)
+    _qxe['E_arrow'] = ax.add_patch(mpatches.FancyArrowPatch(
+        (0, 0), (0, 0), arrowstyle='-|>', color='#2980b9', lw=2.2,
+        linestyle='dashed', mutation_scale=14, zorder=6))
     # dotted component lines
-    ax.plot([0, Ex], [0, 0],   ':', color='#2980b9', lw=1.0, alpha=0.45)
-    ax.plot([Ex, Ex], [0, Ey], ':', color='#2980b9', lw=1.0, alpha=0.45)
+    _qxe['E_cx'], = ax.plot([], [], ':', color='#2980b9', lw=1.0, alpha=0.45)
+    _qxe['E_cy'], = ax.plot([], [], ':', color='#2980b9', lw=1.0, alpha=0.45)
     # simple tip label only (no bbox clutter)
-    ax.text(Ex + 0.25, Ey + 0.20,
-            f"→E\n[{Ex:.1f}, {Ey:.1f}]",
-            fontsize=7.5, color='#2980b9', fontweight='bold', va='bottom')
+    _qxe['E_label'] = ax.text(0, 0, '', fontsize=7.5, color='#2980b9',
+                              fontweight='bold', va='bottom', clip_on=True)
 
     # ── Q dot on the x-axis (orange circle, acts as scalar marker) ──
-    q_x = np.clip(Q_norm, -LIM + 0.3, LIM - 0.3)
-    ax.plot(q_x, 0, 'o', color='#e07b00', markersize=14,
-            markeredgecolor='white', markeredgewidth=2, zorder=9)
-    ax.text(q_x, 0.45,
-            f"Q={Q_val}µC", ha='center', fontsize=7.5,
-            color='#e07b00', fontweight='bold')
+    _qxe['Q_marker'], = ax.plot([], [], 'o', color='#e07b00', markersize=14,
+                                markeredgecolor='white', markeredgewidth=2, zorder=9)
+    _qxe['Q_label'] = ax.text(0, 0.45, '', ha='center', fontsize=7.5,
+                              color='#e07b00', fontweight='bold', clip_on=True)
 
     # ── →F arrow (purple thick) ─────────────────────
-    if F_mag > 0.01:
-        clip = min(1.0, (LIM - 0.4) / F_mag)
-        Fdx, Fdy = Fx * clip, Fy * clip
-        ax.annotate('', xy=(Fdx, Fdy), xytext=(0, 0),
-                    arrowprops=dict(arrowstyle='-|>', color='#8e44ad', lw=3.2,
-                                    mutation_scale=18), zorder=10)
-        ax.plot(Fdx, Fdy, 'D', color='#8e44ad', markersize=8,
-                markeredgecolor='white', markeredgewidth=1.8, zorder=11)
-        # label: push to opposite quadrant from E
-        tx = np.clip(Fdx * 1.35, -LIM + 1.0, LIM - 1.0)
-        ty = np.clip(Fdy * 1.35, -LIM + 1.0, LIM - 1.0)
-        ax.text(tx, ty,
-                f"→F\n[{Fx:.2f}, {Fy:.2f}]\n|F|={F_mag:.2f}",
-                fontsize=7.5, color='#8e44ad', fontweight='bold',
-                ha='center', va='center',
-                bbox=dict(boxstyle='round,pad=0.28', fc='#f9f0ff',
-                          ec='#8e44ad', alpha=0.92, lw=0.9), zorder=12)
-    else:
-        ax.text(0, 1.2, "→F = 0\n(Q = 0)",
-                ha='center', fontsize=9, color='#aaa', style='italic')
-
-    # origin dot
-    ax.plot(0, 0, 'o', color='#555', markersize=5, zorder=15)
+    _qxe['F_arrow'] = ax.add_patch(mpatches.FancyArrowPatch(
+        (0, 0), (0, 0), arrowstyle='-|>', color='#8e44ad', lw=3.2,
+        mutation_scale=18, zorder=10))
+    _qxe['F_marker'], = ax.plot([], [], 'D', color='#8e44ad', markersize=8,
+                                markeredgecolor='white', markeredgewidth=1.8, zorder=11)
+    _qxe['F_label'] = ax.text(0, 0, '', fontsize=7.5, color='#8e44ad', fontweight='bold',
+                              ha='center', va='center', clip_on=True,
+                              bbox=dict(boxstyle='round,pad=0.28', fc='#f9f0ff',
+                                        ec='#8e44ad', alpha=0.92, lw=0.9), zorder=12)
+    _qxe['F_zero'] = ax.text(0, 1.2, "→F = 0\n(Q = 0)",
+                             ha='center', fontsize=9, color='#aaa', style='italic')
+
+    # origin dot (animated too, so it stays on top of the arrows)
+    _qxe['origin'], = ax.plot(0, 0, 'o', color='#555', markersize=5, zorder=15)
+
+    for a in _qxe.values():
+        a.set_animated(True)
+    _qxe_order.extend(sorted(_qxe.values(), key=lambda a: a.get_zorder()))
 
     # minimal colour legend at bottom
-    import matplotlib.lines as mlines
     h1 = mlines.Line2D([], [], color='#2980b9', lw=2, linestyle='--', label='→E  (input vector)')
     h2 = mlines.Line2D([], [], color='#e07b00', marker='o', lw=0, markersize=7, label='Q  (input scalar)')
     h3 = mlines.Line2D([], [], color='#8e44ad', lw=2.5, label='→F  (output vector)')
     ax.legend(handles=[h1, h2, h3], loc='lower right', fontsize=6.5,
               framealpha=0.88, edgecolor='#ccaaee')
 
+    _OVERLAYS['QXE'] = (ax, _qxe_order)
+
+
+def draw_qxE():
+    if not _qxe:
+        _build_qxE()
+
+    Q_val  = SCALAR_DATA["Charge"]["value"]
+    Ex, Ey = VXY[E_IDX]
+    Q_norm, Fx, Fy, F_mag, _ = qxE_kernel(Q_val, Ex, Ey)
+    LIM = QXE_LIM
+
+    _qxe['E_arrow'].set_positions((0, 0), (Ex, Ey))
+    _qxe['E_cx'].set_data([0, Ex], [0, 0])
+    _qxe['E_cy'].set_data([Ex, Ex], [0, Ey])
+    _qxe['E_label'].set_position((Ex + 0.25, Ey + 0.20))
+    _qxe['E_label'].set_text(f"→E\n[{Ex:.1f}, {Ey:.1f}]")
+
+    q_x = np.clip(Q_norm, -LIM + 0.3, LIM - 0.3)
+    _qxe['Q_marker'].set_data([q_x], [0])
+    _qxe['Q_label'].set_x(q_x)
+    _qxe['Q_label'].set_text(f"Q={Q_val}µC")
+
+    has_F = F_mag > 0.01
+    for k in ('F_arrow', 'F_marker', 'F_label'):
+        _qxe[k].set_visible(has_F)
+    _qxe['F_zero'].set_visible(not has_F)
+    if has_F:
+        clip = min(1.0, (LIM - 0.4) / F_mag)
+        Fdx, Fdy = Fx * clip, Fy * clip
+        _qxe['F_arrow'].set_positions((0, 0), (Fdx, Fdy))
+        _qxe['F_marker'].set_data([Fdx], [Fdy])
+        # label: push to opposite quadrant from E
+        tx = np.clip(Fdx * 1.35, -LIM + 1.0, LIM - 1.0)
+        ty = np.clip(Fdy * 1.35, -LIM + 1.0, LIM - 1.0)
+        _qxe['F_label'].set_position((tx, ty))
+        _qxe['F_label'].set_text(f"→F\n[{Fx:.2f}, {Fy:.2f}]\n|F|={F_mag:.2f}")
+
 
 # ══════════════════════════════════════════════════════════════
 #  DRAW  —  Q × E  RIGHT: clean explanation card
 # ══════════════════════════════════════════════════════════════
-def draw_qxE_card():
+# Formula row: colour each symbol separately
+CARD_SYMS = [("→F",  0.07, '#8e44ad', 'bold', 10),
+             ("=",   0.25, '#555555', 'normal', 9),
+             ("Q",   0.33, '#e07b00', 'bold', 10),
+             ("×",   0.46, '#555555', 'bold',  9),
+             ("→E",  0.54, '#2980b9', 'bold', 10)]
+# Type labels below symbols
+CARD_TYPES = [("→F",  0.07, '[vector]', '#8e44ad'),
+              ("Q",   0.33, '[scalar]', '#e07b00'),
+              ("→E",  0.54, '[vector]', '#2980b9')]
+CARD_HLINE_YS = (0.74, 0.48, 0.19)
+# Input rows: (y, colour, value-text role, name-text role)
+CARD_INPUT_ROWS = [(0.67, '#e07b00', 'Q_val', 'Q_name'),
+                   (0.61, '#2980b9', 'E_vec', 'E_name'),
+                   (0.55, '#2980b9', 'E_mag', 'E_ang')]
+CARD_STEP_YS = {'step1': 0.41, 'step2': 0.35, 'step3': 0.29, 'step4': 0.23}
+
+_card = {}   # text role -> Text, built on the first draw
+
+def _build_qxE_card():
     ax = ax_qxe_txt
-    ax.cla()
     ax.axis('off')
     ax.set_facecolor('#fdfbff')
-
-    Q_val  = SCALAR_DATA["Charge"]["value"]
-    E_data = VECTOR_DATA["Electric Field E"]
-    Ex, Ey = E_data["x"], E_data["y"]
-    E_mag  = np.sqrt(Ex**2 + Ey**2)
-    Q_norm = Q_val / 20.0
-    Fx, Fy = Q_norm * Ex, Q_norm * Ey
-    F_mag  = np.sqrt(Fx**2 + Fy**2)
-
-    direction = "Same direction as →E  ✓" if Q_val > 0 else \
-                "OPPOSITE direction  (Q < 0)" if Q_val < 0 else "Zero vector  (Q = 0)"
-    dir_col   = '#27ae60' if Q_val > 0 else ('#e74c3c' if Q_val < 0 else '#999')
-    angle_E   = np.degrees(np.arctan2(Ey, Ex))
-
     T = ax.transAxes   # shorthand
 
     # ── Background card ────────────────────────────────────────────
     ax.add_patch(mpatches.FancyBboxPatch((0, 0), 1, 1,
-        boxstyle='round,pad=0.02', transform=T,
+        boxstyle=_boxstyle('round,pad=0.02'), transform=T,
         facecolor='#fdfbff', edgecolor='#d0b8f0', linewidth=1.2, zorder=0))
 
     # ── Title band ─────────────────────────────────────────────────
     ax.add_patch(mpatches.FancyBboxPatch((0, 0.88), 1, 0.12,
-        boxstyle='square,pad=0', transform=T,
+        boxstyle=_boxstyle('square,pad=0'), transform=T,
         facecolor='#3d1a6e', edgecolor='none', zorder=1))
     ax.text(0.5, 0.940, "SCALAR × VECTOR", ha='center', va='center',
             fontsize=8.5, fontweight='bold', color='white', transform=T, zorder=2)
@@ -247,179 +399,307 @@ def draw_qxE_card():
     # ── Formula row ────────────────────────────────────────────────
     y = 0.81
     ax.add_patch(mpatches.FancyBboxPatch((0.02, y - 0.045), 0.96, 0.072,
-        boxstyle='round,pad=0.01', transform=T,
+        boxstyle=_boxstyle('round,pad=0.01'), transform=T,
         facecolor='#f3eaff', edgecolor='#c9a0f7', linewidth=0.8, zorder=1))
-    # Colour each symbol separately
-    syms = [("→F",  0.07, '#8e44ad', 'bold', 10),
-            ("=",   0.25, '#555555', 'normal', 9),
-            ("Q",   0.33, '#e07b00', 'bold', 10),
-            ("×",   0.46, '#555555', 'bold',  9),
-            ("→E",  0.54, '#2980b9', 'bold', 10)]
-    for sym, sx, sc, fw, fs in syms:
+    for sym, sx, sc, fw, fs in CARD_SYMS:
         ax.text(sx, y, sym, ha='center', va='center',
                 fontsize=fs, color=sc, fontweight=fw, transform=T, zorder=2)
-
-    # Type labels below symbols
-    types = [("→F",  0.07, '[vector]', '#8e44ad'),
-             ("Q",   0.33, '[scalar]', '#e07b00'),
-             ("→E",  0.54, '[vector]', '#2980b9')]
-    for _, sx, lbl, lc in types:
+    for _, sx, lbl, lc in CARD_TYPES:
         ax.text(sx, y - 0.040, lbl, ha='center', va='center',
                 fontsize=6, color=lc, style='italic', transform=T, zorder=2)
 
-    # ── Divider ────────────────────────────────────────────────────
-    def hline(y_pos):
+    # ── Dividers ───────────────────────────────────────────────────
+    for y_pos in CARD_HLINE_YS:
         ax.plot([0.04, 0.96], [y_pos, y_pos], '-', color='#e0d0f5',
                 lw=0.8, transform=T, zorder=1)
 
-    hline(0.74)
-
     # ── Input block ────────────────────────────────────────────────
     ax.text(0.05, 0.72, "INPUTS", fontsize=7, fontweight='bold',
             color='#555', transform=T, zorder=2)
-
-    rows_in = [
-        (0.67, '#e07b00', f"Q  =  {Q_val} µC",          "Charge  [SCALAR]"),
-        (0.61, '#2980b9', f"→E =  [{Ex:.1f}, {Ey:.1f}]", "Electric Field  [VECTOR]"),
-        (0.55, '#2980b9', f"|E|=  {E_mag:.2f} V/m",      f"θ = {angle_E:.1f}°"),
-    ]
-    for ry, rc, rv, rn in rows_in:
-        ax.text(0.06, ry, rv, fontsize=7.5, color=rc, fontweight='bold',
-                transform=T, zorder=2, fontfamily='monospace')
-        ax.text(0.06, ry - 0.048, rn, fontsize=6.5, color='#888',
-                transform=T, zorder=2, style='italic')
-
-    hline(0.48)
+    for ry, rc, rv, rn in CARD_INPUT_ROWS:
+        _card[rv] = ax.text(0.06, ry, '', fontsize=7.5, color=rc, fontweight='bold',
+                            transform=T, zorder=2, fontfamily='monospace')
+        _card[rn] = ax.text(0.06, ry - 0.048, '', fontsize=6.5, color='#888',
+                            transform=T, zorder=2, style='italic')
+    _card['Q_name'].set_text("Charge  [SCALAR]")
+    _card['E_name'].set_text("Electric Field  [VECTOR]")
 
     # ── Step-by-step ───────────────────────────────────────────────
     ax.text(0.05, 0.46, "CALCULATION", fontsize=7, fontweight='bold',
             color='#555', transform=T, zorder=2)
-
-    steps = [
-        (0.41, f"→F  =  Q  ×  →E"),
-        (0.35, f"    =  {Q_norm:.3f}  ×  [{Ex}, {Ey}]"),
-        (0.29, f"    =  [{Fx:.3f},  {Fy:.3f}]"),
-        (0.23, f"|F| =  {F_mag:.3f}  N"),
-    ]
-    for sy, st in steps:
-        ax.text(0.06, sy, st, fontsize=7.2, color='#333',
-                transform=T, zorder=2, fontfamily='monospace')
-
-    hline(0.19)
+    for role, sy in CARD_STEP_YS.items():
+        _card[role] = ax.text(0.06, sy, '', fontsize=7.2, color='#333',
+                              transform=T, zorder=2, fontfamily='monospace')
+    _card['step1'].set_text("→F  =  Q  ×  →E")
 
     # ── Output block ───────────────────────────────────────────────
     ax.add_patch(mpatches.FancyBboxPatch((0.02, 0.01), 0.96, 0.17,
-        boxstyle='round,pad=0.01', transform=T,
+        boxstyle=_boxstyle('round,pad=0.01'), transform=T,
         facecolor='#f5eeff', edgecolor='#8e44ad', linewidth=1.0, zorder=1))
     ax.text(0.5, 0.155, "OUTPUT", ha='center', fontsize=7, fontweight='bold',
             color='#6a0dad', transform=T, zorder=2)
-    ax.text(0.5, 0.110,
-            f"→F = [{Fx:.3f},  {Fy:.3f}]  N",
+    _card['out_vec'] = ax.text(0.5, 0.110, '',
             ha='center', fontsize=8, fontweight='bold', color='#8e44ad',
             transform=T, zorder=2, fontfamily='monospace')
-    ax.text(0.5, 0.068,
-            f"|F| = {F_mag:.3f} N     Type: VECTOR QUANTITY",
+    _card['out_mag'] = ax.text(0.5, 0.068, '',
             ha='center', fontsize=6.8, color='#6a0dad',
             transform=T, zorder=2)
-    ax.text(0.5, 0.030, direction, ha='center', fontsize=7,
-            fontweight='bold', color=dir_col, transform=T, zorder=2)
+    _card['out_dir'] = ax.text(0.5, 0.030, '', ha='center', fontsize=7,
+            fontweight='bold', transform=T, zorder=2)
+
+
+def draw_qxE_card():
+    if not _card:
+        _build_qxE_card()
+
+    Q_val  = SCALAR_DATA["Charge"]["value"]
+    Ex, Ey = VXY[E_IDX]
+    E_mag  = VMAG[E_IDX]
+    Q_norm, Fx, Fy, F_mag, angle_E = qxE_kernel(Q_val, Ex, Ey)
+
+    direction = "Same direction as →E  ✓" if Q_val > 0 else \
+                "OPPOSITE direction  (Q < 0)" if Q_val < 0 else "Zero vector  (Q = 0)"
+    dir_col   = '#27ae60' if Q_val > 0 else ('#e74c3c' if Q_val < 0 else '#999')
+
+    _card['Q_val'].set_text(f"Q  =  {Q_val} µC")
+    _card['E_vec'].set_text(f"→E =  [{Ex:.1f}, {Ey:.1f}]")
+    _card['E_mag'].set_text(f"|E|=  {E_mag:.2f} V/m")
+    _card['E_ang'].set_text(f"θ = {angle_E:.1f}°")
+    _card['step2'].set_text(f"    =  {Q_norm:.3f}  ×  [{Ex}, {Ey}]")
+    _card['step3'].set_text(f"    =  [{Fx:.3f},  {Fy:.3f}]")
+    _card['step4'].set_text(f"|F| =  {F_mag:.3f}  N")
+    _card['out_vec'].set_text(f"→F = [{Fx:.3f},  {Fy:.3f}]  N")
+    _card['out_mag'].set_text(f"|F| = {F_mag:.3f} N     Type: VECTOR QUANTITY")
+    _card['out_dir'].set_text(direction)
+    _card['out_dir'].set_color(dir_col)
+
+
+# ══════════════════════════════════════════════════════════════
+#  DRAW  —  Tables  (built once; rows restyled only when marked dirty)
+# ══════════════════════════════════════════════════════════════
+def _show_table(hidden_txt, artists, visible):
+    if hidden_txt.get_visible() != visible:
+        return   # already in the requested state
+    hidden_txt.set_visible(not visible)
+    for a in artists:
+        a.set_visible(visible)
 
 
 # ══════════════════════════════════════════════════════════════
 #  DRAW  —  Scalar Table
 # ══════════════════════════════════════════════════════════════
-def draw_scalar_table():
-    ax = ax_stbl; ax.cla(); ax.axis('off')
-    if not scalar_table_visible:
-        ax.text(0.5, 0.5, 'Scalar table hidden\n(click  [▼ Scalar Table]  to show)',
-                ha='center', va='center', fontsize=10, color='#bbbbbb',
-                transform=ax.transAxes, style='italic')
-        return
-    hdr = mpatches.FancyBboxPatch((0,0.915),1,0.085, boxstyle='square,pad=0',
-          transform=ax.transAxes, facecolor='#e07b00', edgecolor='none')
+_stbl_rows = {}                 # scalar name -> {'bg','name','val','unit','sym'}
+_stbl_static = []               # header band, titles, footnote
+_stbl_hidden = None             # placeholder shown while the table is hidden
+_stbl_dirty = set(SCALAR_DATA)  # rows whose value/highlight need refreshing
+
+def _build_scalar_table():
+    global _stbl_hidden
+    ax = ax_stbl; ax.axis('off'); T = ax.transAxes
+    _stbl_hidden = ax.text(0.5, 0.5, 'Scalar table hidden\n(click  [▼ Scalar Table]  to show)',
+                           ha='center', va='center', fontsize=10, color='#bbbbbb',
+                           transform=T, style='italic', visible=False)
+    hdr = mpatches.FancyBboxPatch((0,0.915),1,0.085, boxstyle=_boxstyle('square,pad=0'),
+          transform=T, facecolor='#e07b00', edgecolor='none')
     ax.add_patch(hdr)
-    ax.text(0.5,0.955,'Scalar Quantities  —  Electronics', ha='center',
-            fontsize=10, fontweight='bold', color='white', transform=ax.transAxes)
+    _stbl_static.append(hdr)
+    _stbl_static.append(ax.text(0.5,0.955,'Scalar Quantities  —  Electronics', ha='center',
+            fontsize=10, fontweight='bold', color='white', transform=T))
     cols=[0.02,0.38,0.58,0.82]; row_h=0.088; y0=0.905
     for j,h in enumerate(['Quantity','Value','Unit','Sym']):
-        ax.text(cols[j], y0, h, fontsize=8, fontweight='bold',
-                color='#e07b00', transform=ax.transAxes)
+        _stbl_static.append(ax.text(cols[j], y0, h, fontsize=8, fontweight='bold',
+                color='#e07b00', transform=T))
     for i,(name,dq) in enumerate(SCALAR_DATA.items()):
-        y=y0-(i+1)*row_h; is_a=(name==active_scalar)
+        y=y0-(i+1)*row_h
+        r=mpatches.FancyBboxPatch((0,y-0.012),1,row_h, boxstyle=_boxstyle('square,pad=0'),
+          transform=T, edgecolor='none')
+        ax.add_patch(r)
+        _stbl_rows[name] = {
+            'bg':   r,
+            'name': ax.text(cols[0],y,name,          fontsize=8,transform=T),
+            'val':  ax.text(cols[1],y,'',            fontsize=8,color='#e07b00',fontweight='bold',transform=T),
+            'unit': ax.text(cols[2],y,dq["unit"],    fontsize=8,color='#888888',transform=T),
+            'sym':  ax.text(cols[3],y,dq["symbol"],  fontsize=8,color='#555555',transform=T),
+        }
+    # footnote
+    _stbl_static.append(ax.text(0.02, 0.01, "★ Charge (Q) feeds the Q×E graph below",
+            fontsize=7, color='#8e44ad', style='italic', transform=T))
+
+
+def draw_scalar_table():
+    if not _stbl_rows:
+        _build_scalar_table()
+    _show_table(_stbl_hidden,
+                [*_stbl_static, *(a for row in _stbl_rows.values() for a in row.values())],
+                scalar_table_visible)
+    for name in _stbl_dirty:
+        i=SIDX[name]; dq=SCALAR_DATA[name]; is_a=(name==active_scalar)
         # highlight Charge row always in light purple (it feeds QxE)
         if name == "Charge":
             bg = '#f5eeff' if not is_a else '#e0c8ff'
         else:
             bg = '#fff3e0' if is_a else ('#fff8f0' if i%2==0 else '#ffffff')
-        r=mpatches.FancyBboxPatch((0,y-0.012),1,row_h, boxstyle='square,pad=0',
-          transform=ax.transAxes, facecolor=bg, edgecolor='none')
-        ax.add_patch(r)
-        fw='bold' if (is_a or name=="Charge") else 'normal'
-        fc='#6a0dad' if name=="Charge" else ('#b35c00' if is_a else '#222222')
-        ax.text(cols[0],y,name,           fontsize=8,color=fc,fontweight=fw,transform=ax.transAxes)
-        ax.text(cols[1],y,str(dq["value"]),fontsize=8,color='#e07b00',fontweight='bold',transform=ax.transAxes)
-        ax.text(cols[2],y,dq["unit"],      fontsize=8,color='#888888',transform=ax.transAxes)
-        ax.text(cols[3],y,dq["symbol"],    fontsize=8,color='#555555',transform=ax.transAxes)
-    # footnote
-    ax.text(0.02, 0.01, "★ Charge (Q) feeds the Q×E graph below",
-            fontsize=7, color='#8e44ad', style='italic', transform=ax.transAxes)
+        cell = _stbl_rows[name]
+        cell['bg'].set_facecolor(bg)
+        cell['name'].set_fontweight('bold' if (is_a or name=="Charge") else 'normal')
+        cell['name'].set_color('#6a0dad' if name=="Charge" else ('#b35c00' if is_a else '#222222'))
+        cell['val'].set_text(str(dq["value"]))
+    _stbl_dirty.clear()
 
 
 # ══════════════════════════════════════════════════════════════
 #  DRAW  —  Vector Table
 # ══════════════════════════════════════════════════════════════
-def draw_vector_table():
-    ax = ax_vtbl; ax.cla(); ax.axis('off')
-    if not vector_table_visible:
-        ax.text(0.5, 0.5, 'Vector table hidden\n(click  [▼ Vector Table]  to show)',
-                ha='center', va='center', fontsize=10, color='#bbbbbb',
-                transform=ax.transAxes, style='italic')
-        return
-    hdr = mpatches.FancyBboxPatch((0,0.935),1,0.065, boxstyle='square,pad=0',
-          transform=ax.transAxes, facecolor='#1a56db', edgecolor='none')
+_vtbl_rows = {}                 # vector name -> {'bg','dot','name','x','y','mag','unit'}
+_vtbl_static = []
+_vtbl_hidden = None
+_vtbl_dirty = set(VNAMES)
+
+def _build_vector_table():
+    global _vtbl_hidden
+    ax = ax_vtbl; ax.axis('off'); T = ax.transAxes
+    _vtbl_hidden = ax.text(0.5, 0.5, 'Vector table hidden\n(click  [▼ Vector Table]  to show)',
+                           ha='center', va='center', fontsize=10, color='#bbbbbb',
+                           transform=T, style='italic', visible=False)
+    hdr = mpatches.FancyBboxPatch((0,0.935),1,0.065, boxstyle=_boxstyle('square,pad=0'),
+          transform=T, facecolor='#1a56db', edgecolor='none')
     ax.add_patch(hdr)
-    ax.text(0.5,0.965,'Vector Quantities  —  Electronics & Comm.', ha='center',
-            fontsize=10, fontweight='bold', color='white', transform=ax.transAxes)
+    _vtbl_static.append(hdr)
+    _vtbl_static.append(ax.text(0.5,0.965,'Vector Quantities  —  Electronics & Comm.', ha='center',
+            fontsize=10, fontweight='bold', color='white', transform=T))
     cols=[0.02,0.46,0.60,0.74,0.88]; row_h=0.082; y0=0.925
     for j,h in enumerate(['Quantity','x','y','|v|','Unit']):
-        ax.text(cols[j],y0,h, fontsize=8, fontweight='bold',
-                color='#1a56db', transform=ax.transAxes)
-    for i,(name,dv) in enumerate(VECTOR_DATA.items()):
-        vx=dv["x"]; vy=dv["y"]; mag=np.sqrt(vx**2+vy**2)
-        y=y0-(i+1)*row_h; is_a=(name==active_vector)
-        is_E = (name == "Electric Field E")
+        _vtbl_static.append(ax.text(cols[j],y0,h, fontsize=8, fontweight='bold',
+                color='#1a56db', transform=T))
+    for i,name in enumerate(VNAMES):
+        y=y0-(i+1)*row_h; col=VEC_COLORS[i]
+        r=mpatches.FancyBboxPatch((0,y-0.010),1,row_h, boxstyle=_boxstyle('square,pad=0'),
+          transform=T, edgecolor='none')
+        ax.add_patch(r)
+        circ=mpatches.Circle((0.015,y+0.022),0.012,
+             transform=T, color=col, zorder=5)
+        ax.add_patch(circ)
+        _vtbl_rows[name] = {
+            'bg':   r,
+            'dot':  circ,
+            'name': ax.text(cols[0]+0.03,y,name,  fontsize=7.8,transform=T),
+            'x':    ax.text(cols[1],y,'',         fontsize=7.8,color='#1a56db',transform=T),
+            'y':    ax.text(cols[2],y,'',         fontsize=7.8,color='#e02020',transform=T),
+            'mag':  ax.text(cols[3],y,'',         fontsize=7.8,color='#333333',fontweight='bold',transform=T),
+            'unit': ax.text(cols[4],y,VUNIT[i],   fontsize=7.5,color='#888888',transform=T),
+        }
+    _vtbl_static.append(ax.text(0.02, 0.01, "★ Electric Field E  feeds the Q×E graph below",
+            fontsize=7, color='#8e44ad', style='italic', transform=T))
+
+
+def draw_vector_table():
+    if not _vtbl_rows:
+        _build_vector_table()
+    _show_table(_vtbl_hidden,
+                [*_vtbl_static, *(a for row in _vtbl_rows.values() for a in row.values())],
+                vector_table_visible)
+    for name in _vtbl_dirty:
+        i=VIDX[name]; vx, vy = VXY[i]; mag = VMAG[i]
+        is_a=(i==active_vector)
+        is_E = (i == E_IDX)
         if is_E:
             bg = '#f5eeff' if not is_a else '#e0c8ff'
         else:
             bg = '#eef3ff' if is_a else ('#f5f8ff' if i%2==0 else '#ffffff')
-        col=VEC_COLORS[i]
-        r=mpatches.FancyBboxPatch((0,y-0.010),1,row_h, boxstyle='square,pad=0',
-          transform=ax.transAxes, facecolor=bg, edgecolor='none')
-        ax.add_patch(r)
-        circ=mpatches.Circle((0.015,y+0.022),0.012,
-             transform=ax.transAxes, color=col, zorder=5)
-        ax.add_patch(circ)
-        fw='bold' if (is_a or is_E) else 'normal'
-        fc = '#6a0dad' if is_E else col
-        ax.text(cols[0]+0.03,y,name,          fontsize=7.8,color=fc,fontweight=fw,transform=ax.transAxes)
-        ax.text(cols[1],y,str(round(vx,2)),   fontsize=7.8,color='#1a56db',transform=ax.transAxes)
-        ax.text(cols[2],y,str(round(vy,2)),   fontsize=7.8,color='#e02020',transform=ax.transAxes)
-        ax.text(cols[3],y,str(round(mag,2)),  fontsize=7.8,color='#333333',fontweight='bold',transform=ax.transAxes)
-        ax.text(cols[4],y,dv["unit"],         fontsize=7.5,color='#888888',transform=ax.transAxes)
-    ax.text(0.02, 0.01, "★ Electric Field E  feeds the Q×E graph below",
-            fontsize=7, color='#8e44ad', style='italic', transform=ax.transAxes)
+        cell = _vtbl_rows[name]
+        cell['bg'].set_facecolor(bg)
+        cell['name'].set_fontweight('bold' if (is_a or is_E) else 'normal')
+        cell['name'].set_color('#6a0dad' if is_E else VEC_COLORS[i])
+        cell['x'].set_text(f"{vx:.2f}")
+        cell['y'].set_text(f"{vy:.2f}")
+        cell['mag'].set_text(f"{mag:.2f}")
+    _vtbl_dirty.clear()
+
+
+# Panels needing a redraw; each edit marks only the panels it affects
+_DISPATCH = {
+    'SLINE': draw_scalar_line,
+    'VGRID': draw_vector_grid,
+    'STBL':  draw_scalar_table,
+    'VTBL':  draw_vector_table,
+    'QXE':   draw_qxE,
+    'CARD':  draw_qxE_card,
+}
+DIRTY = set(_DISPATCH)
+
+_pending_redraw = False     # a redraw was skipped while the window was unmapped
+_first_redraw = True        # the startup build, which runs before plt.show() maps the window
 
+def _is_visible():
+    try:
+        return bool(fig.canvas.manager.window.winfo_viewable())
+    except Exception:          # not a Tk window: assume it is on screen
+        return True
 
 def redraw_all():
-    draw_scalar_line()
-    draw_vector_grid()
-    draw_scalar_table()
-    draw_vector_table()
-    draw_qxE()
-    draw_qxE_card()
+    global _pending_redraw, _first_redraw
+    # Nothing to show while minimised; DIRTY keeps accumulating until <Map>.
+    # The startup build always runs, or the first frame would be empty axes.
+    if not _first_redraw and not _is_visible():
+        _pending_redraw = True
+        return
+    _first_redraw = False
+    # Changes confined to overlay panels are blitted; anything else (tables,
+    # card, number line, toggles) needs a full canvas draw
+    tags = set(DIRTY)
+    blit_only = bool(tags) and tags <= _overlay_bg.keys()
+    for t in tags:
+        _DISPATCH[t]()
+    DIRTY.clear()
+    _pending_redraw = False
     update_toggle_labels()
+    if blit_only and not _draw_scheduled[0]:
+        redraw_overlays(tags)
+    else:
+        redraw_backgrounds()
+
+
+def redraw_backgrounds():
+    schedule_draw()
+
+
+# Popups hand the redraw to a one-shot GUI timer so they close at once
+# instead of waiting for it; Matplotlib artists and Tk are not thread-safe,
+# so the work itself stays on the GUI thread
+_redraw_timer = fig.canvas.new_timer(interval=0)
+_redraw_timer.single_shot = True
+_redraw_timer.add_callback(redraw_all)
+
+def queue_redraw():
+    _redraw_timer.stop()    # coalesce with a redraw that is already queued
+    _redraw_timer.start()
+
+# At most one canvas render per burst of redraws, however many panels changed
+_draw_scheduled = [False]
+
+def _do_draw():
+    _draw_scheduled[0] = False
     fig.canvas.draw_idle()
 
+_draw_timer = fig.canvas.new_timer(interval=0)
+_draw_timer.single_shot = True
+_draw_timer.add_callback(_do_draw)
+
+def schedule_draw():
+    if _draw_scheduled[0]:
+        return
+    _draw_scheduled[0] = True
+    _draw_timer.start()
+
+def _on_map(event):
+    if _pending_redraw:
+        redraw_all()
+
+try:
+    fig.canvas.manager.window.bind('<Map>', _on_map, add='+')
+except AttributeError:
+    pass
+
 
 # ══════════════════════════════════════════════════════════════
 #  POPUP — SCALAR
@@ -447,11 +727,9 @@ def enter_scalar(event):
     sb.config(command=lb.yview); sb.pack(side='right', fill='y'); lb.pack(fill='x')
 
     names = list(SCALAR_DATA.keys())
-    for i, nm in enumerate(names):
-        d = SCALAR_DATA[nm]
-        prefix = "★ " if nm == "Charge" else "  "
-        lb.insert('end', f"{prefix}{nm:<22}  =  {d['value']}  {d['unit']}")
-        if nm == active_scalar: lb.selection_set(i); lb.see(i)
+    lb.insert('end', *[f"{'★ ' if nm == 'Charge' else '  '}{nm:<22}  =  {d['value']}  {d['unit']}"
+                       for nm, d in SCALAR_DATA.items()])
+    i = SIDX[active_scalar]; lb.selection_set(i); lb.see(i)
 
     vf = tk.Frame(win, bg='#fff8f0'); vf.pack(fill='x', padx=20, pady=(10,0))
     info_lbl = tk.Label(vf, text="", font=("Arial",8), fg='#888888', bg='#fff8f0')
@@ -463,32 +741,51 @@ def enter_scalar(event):
                       width=18, bd=2, relief='groove', justify='center')
     entry.pack(anchor='w'); entry.focus()
 
+    # Arrow-key scrolling fires a select per row; only the last one is shown
+    _pending = [None]
     def on_sel(e=None):
+        if _pending[0]: win.after_cancel(_pending[0])
+        _pending[0] = win.after(50, _do_sel)
+
+    def _do_sel():
+        _pending[0] = None
         sel = lb.curselection()
         if sel:
-            nm=names[sel[0]]; d=SCALAR_DATA[nm]; lo,hi=d["range"]
-            info_lbl.config(text=f"Range: {lo} to {hi}  {d['unit']}  |  Symbol: {d['symbol']}")
+            d=SCALAR_DATA[names[sel[0]]]
+            info_lbl.config(text=SCALAR_INFO.format_map(d))
             evar.set(str(d["value"]))
-    lb.bind('<<ListboxSelect>>', on_sel); on_sel()
+    lb.bind('<<ListboxSelect>>', on_sel); _do_sel()
 
     msg = tk.Label(win, text="", font=("Arial",9), fg='red', bg='#fff8f0'); msg.pack(pady=2)
 
     def on_ok():
         global active_scalar
+        # Selection moved but its value is not shown yet: show it, don't commit
+        if _pending[0]:
+            win.after_cancel(_pending[0]); _do_sel(); return
         sel=lb.curselection()
         if not sel: msg.config(text="Please select a quantity."); return
         nm=names[sel[0]]; d=SCALAR_DATA[nm]; lo,hi=d["range"]
         try: val=float(evar.get())
         except: msg.config(text="Invalid number."); return
         if not (lo<=val<=hi): msg.config(text=f"Value must be between {lo} and {hi}."); return
-        SCALAR_DATA[nm]["value"]=val; active_scalar=nm; win.destroy(); redraw_all()
+        d["value"]=val; _stbl_dirty.update((nm, active_scalar))
+        DIRTY.update(('SLINE','STBL'))
+        if nm=="Charge": DIRTY.update(('QXE','CARD'))
+        active_scalar=nm; win.destroy(); queue_redraw()
+
+    def on_cancel():
+        if _pending[0]: win.after_cancel(_pending[0])
+        win.destroy()
+    win.protocol('WM_DELETE_WINDOW', on_cancel)
 
     bf=tk.Frame(win,bg='#fff8f0'); bf.pack(pady=14)
     tk.Button(bf,text="  OK  ",command=on_ok,bg='#e07b00',fg='white',
               font=("Arial",10,"bold"),relief='flat',padx=10).pack(side='left',padx=8)
-    tk.Button(bf,text="Cancel",command=win.destroy,bg='#eeeeee',fg='#555555',
+    tk.Button(bf,text="Cancel",command=on_cancel,bg='#eeeeee',fg='#555555',
               font=("Arial",10),relief='flat',padx=10).pack(side='left',padx=8)
-    win.bind('<Return>', lambda e: on_ok()); win.mainloop()
+    win.bind('<Return>', lambda e: on_ok())
+    win.update_idletasks(); win.mainloop()   # lay out once before the first frame
 
 
 # ══════════════════════════════════════════════════════════════
@@ -515,12 +812,10 @@ def enter_vector(event):
                    yscrollcommand=sb.set,activestyle='none',bg='white',relief='flat',bd=0)
     sb.config(command=lb.yview); sb.pack(side='right',fill='y'); lb.pack(fill='x')
 
-    names=list(VECTOR_DATA.keys())
-    for i,nm in enumerate(names):
-        d=VECTOR_DATA[nm]; mag=np.sqrt(d["x"]**2+d["y"]**2)
-        prefix="★ " if nm=="Electric Field E" else "  "
-        lb.insert('end',f"{prefix}{nm:<24}  |v|={mag:.2f}  {d['unit']}")
-        if nm==active_vector: lb.selection_set(i); lb.see(i)
+    names=VNAMES
+    lb.insert('end',*[f"{'★ ' if i==E_IDX else '  '}{nm:<24}  |v|={VMAG[i]:.2f}  {VUNIT[i]}"
+                      for i,nm in enumerate(names)])
+    lb.selection_set(active_vector); lb.see(active_vector)
 
     cf=tk.Frame(win,bg='#f0f4ff'); cf.pack(fill='x',padx=20,pady=(10,0))
     unit_lbl=tk.Label(cf,text="",font=("Arial",8),fg='#888888',bg='#f0f4ff')
@@ -528,50 +823,83 @@ def enter_vector(event):
 
     rx=tk.Frame(cf,bg='#f0f4ff'); rx.pack(anchor='w',pady=2)
     tk.Label(rx,text="X component : ",font=("Arial",9,"bold"),fg='#1a56db',bg='#f0f4ff').pack(side='left')
-    xvar=tk.StringVar(value=str(VECTOR_DATA[active_vector]["x"]))
+    xvar=tk.StringVar(value=str(VXY[active_vector, 0]))
     tk.Entry(rx,textvariable=xvar,font=("Courier",12),width=12,bd=2,relief='groove',justify='center').pack(side='left')
 
     ry=tk.Frame(cf,bg='#f0f4ff'); ry.pack(anchor='w',pady=2)
     tk.Label(ry,text="Y component : ",font=("Arial",9,"bold"),fg='#e02020',bg='#f0f4ff').pack(side='left')
-    yvar=tk.StringVar(value=str(VECTOR_DATA[active_vector]["y"]))
+    yvar=tk.StringVar(value=str(VXY[active_vector, 1]))
     tk.Entry(ry,textvariable=yvar,font=("Courier",12),width=12,bd=2,relief='groove',justify='center').pack(side='left')
 
     mag_lbl=tk.Label(cf,text="",font=("Courier",9,"bold"),fg='#333333',bg='#f0f4ff')
     mag_lbl.pack(anchor='w',pady=(6,0))
 
     def upd_mag(*a):
-        try: m=np.sqrt(float(xvar.get())**2+float(yvar.get())**2); mag_lbl.config(text=f"|v| = {m:.4f}")
-        except: mag_lbl.config(text="")
-
+        _mag_queued[0]=False
+        sx=xvar.get(); sy=yvar.get()
+        if not sx or not sy: mag_lbl.config(text=""); return
+        try: m=math.hypot(float(sx), float(sy)); mag_lbl.config(text=f"|v| = {m:.4f}")
+        except ValueError: mag_lbl.config(text="")
+
+    # Typing queues one idle refresh per event-loop turn; _do_sel's own set()
+    # calls are muted and followed by a single explicit upd_mag()
+    _mag_queued=[False]; _suspend_mag=[False]
+    def _trace(*a):
+        if _suspend_mag[0] or _mag_queued[0]: return
+        _mag_queued[0]=True; win.after_idle(upd_mag)
+
+    _pending=[None]
     def on_sel(e=None):
+        if _pending[0]: win.after_cancel(_pending[0])
+        _pending[0]=win.after(50,_do_sel)
+
+    def _do_sel():
+        _pending[0]=None
         sel=lb.curselection()
         if sel:
-            nm=names[sel[0]]; d=VECTOR_DATA[nm]
-            unit_lbl.config(text=f"Unit: {d['unit']}  |  Symbol: {d['symbol']}  |  Range: -6 to 6")
-            xvar.set(str(d["x"])); yvar.set(str(d["y"])); upd_mag()
+            i=sel[0]
+            unit_lbl.config(text=VECTOR_INFO.format_map(VECTOR_DATA[names[i]]))
+            _suspend_mag[0]=True
+            xvar.set(str(VXY[i, 0])); yvar.set(str(VXY[i, 1]))
+            _suspend_mag[0]=False; upd_mag()
 
     lb.bind('<<ListboxSelect>>',on_sel)
-    xvar.trace_add('write',upd_mag); yvar.trace_add('write',upd_mag); on_sel()
+    xvar.trace_add('write',_trace); yvar.trace_add('write',_trace); _do_sel()
 
     msg=tk.Label(win,text="",font=("Arial",9),fg='red',bg='#f0f4ff'); msg.pack(pady=2)
 
     def on_ok():
         global active_vector
+        # Selection moved but its values are not shown yet: show them, don't commit
+        if _pending[0]:
+            win.after_cancel(_pending[0]); _do_sel(); return
         sel=lb.curselection()
         if not sel: msg.config(text="Please select a quantity."); return
-        nm=names[sel[0]]
+        i=sel[0]
         try: vx=float(xvar.get()); vy=float(yvar.get())
         except: msg.config(text="Invalid number."); return
         if not(-6<=vx<=6) or not(-6<=vy<=6): msg.config(text="Both components must be -6 to 6."); return
-        VECTOR_DATA[nm]["x"]=vx; VECTOR_DATA[nm]["y"]=vy; active_vector=nm
-        win.destroy(); redraw_all()
+        VXY[i]=vx, vy; VMAG[i]=math.hypot(vx, vy)
+        _vtbl_dirty.update((names[i], names[active_vector]))
+        # A hidden table picks up _vtbl_dirty when it is toggled back on
+        DIRTY.add('VGRID')
+        if vector_table_visible: DIRTY.add('VTBL')
+        if i==E_IDX: DIRTY.update(('QXE','CARD'))
+        active_vector=i
+        win.destroy(); queue_redraw()
+
+    def on_cancel():
+        if _pending[0]: win.after_cancel(_pending[0])
+        win.destroy()
+    win.protocol('WM_DELETE_WINDOW', on_cancel)
 
     bf=tk.Frame(win,bg='#f0f4ff'); bf.pack(pady=14)
     tk.Button(bf,text="  OK  ",command=on_ok,bg='#1a56db',fg='white',
               font=("Arial",10,"bold"),relief='flat',padx=10).pack(side='left',padx=8)
-    tk.Button(bf,text="Cancel",command=win.destroy,bg='#eeeeee',fg='#555555',
+    tk.Button(bf,text="Cancel",command=on_cancel,bg='#eeeeee',fg='#555555',
               font=("Arial",10),relief='flat',padx=10).pack(side='left',padx=8)
-    win.bind('<Return>',lambda e:on_ok()); win.mainloop()
+    win.bind('<Return>',lambda e:on_ok())
+    win.update_idletasks(); win.mainloop()   # lay out once before the first frame
 
 
 # ══════════════════════════════════════════════════════════════
@@ -580,12 +908,12 @@ def enter_vector(event):
 def toggle_scalar_table(event):
     global scalar_table_visible
     scalar_table_visible = not scalar_table_visible
-    redraw_all()
+    DIRTY.add('STBL'); redraw_all()
 
 def toggle_vector_table(event):
     global vector_table_visible
     vector_table_visible = not vector_table_visible
-    redraw_all()
+    DIRTY.add('VTBL'); redraw_all()
 
 def update_toggle_labels():
     s_arrow = "v" if scalar_table_visible else ">"
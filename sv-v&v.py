@@ -1,6 +1,16 @@
+from collections import deque
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider, RadioButtons
+from matplotlib.collections import LineCollection
+from matplotlib.patches import FancyArrowPatch
+from matplotlib.transforms import Bbox
+from matplotlib.widgets import Slider, Button
+
+try:
+    from numba import njit
+except ImportError:                      # numba is optional
+    def njit(*args, **kwargs):
+        return lambda f: f
 
 # ==============================================================================
 #  CONFIGURATION & STYLING
@@ -13,10 +23,41 @@ COLORS = {
     'neg': '#d62728',     # Red (Negative Result)
     'grid': '#e5e5e5'
 }
+# Let Agg merge near-collinear path vertices when stroking lines
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+# Mathtext halves of the formula boxes; only the plain-text value beside them
+# changes per frame, so mathtext is parsed once per string, not per slider tick
+EQ_LEFT = r"$\vec{V}_{out} = \sigma \cdot \vec{V}_{in},\ \sigma =$"
+EQ_RIGHT = {'Dot Product': r"$\vec{V}_1 \cdot \vec{V}_2 =$",
+            'Cross Product': r"$\vec{V}_1 \times \vec{V}_2 =$"}
+# Arrow labels: offset from the tip away from the axes, and their backdrop
+LABEL_OFFSET = {True: 0.3, False: -0.8}
+LABEL_BBOX = dict(boxstyle="round,pad=0.1", fc="white", ec="none", alpha=0.7)
+TRAIL_LEN = 128   # recent result tips shown as a ghost trail on the left plot
+
+# ==============================================================================
+#  KERNELS (explicit signatures: compiled, or loaded from cache, at import)
+# ==============================================================================
+@njit("UniTuple(float64, 2)(float64, float64, float64)", cache=True, fastmath=True)
+def compute_left(sigma, vx, vy):
+    """sigma * (vx, vy)."""
+    return sigma * vx, sigma * vy
+
+@njit("UniTuple(float64, 5)(float64, float64, float64, float64)", cache=True, fastmath=True)
+def compute_right(v1x, v1y, v2x, v2y):
+    """(dot, cross_z, proj_x, proj_y, |v2|^2); the projection is zero for a zero v2."""
+    dot = v1x*v2x + v1y*v2y
+    cross_z = v1x*v2y - v1y*v2x
+    v2n2 = v2x*v2x + v2y*v2y
+    k = dot / v2n2 if v2n2 > 1e-12 else 0.0
+    return dot, cross_z, k*v2x, k*v2y, v2n2
 
 class DualVectorVisualizer:
     def __init__(self):
         self.fig = plt.figure(figsize=(16, 8))
+        # Axes are placed by hand; no layout pass on each draw, whatever the rc says
+        self.fig.set_layout_engine('none')
         self.fig.canvas.manager.set_window_title("Vector Operations Comparison")
         self.fig.patch.set_facecolor('#fafafa')
 
@@ -32,12 +73,30 @@ class DualVectorVisualizer:
         self.ax_txt_r.axis('off')
 
         # Mode switch for Right Plot (Dot vs Cross)
-        self.ax_radio = self.fig.add_axes([0.80, 0.88, 0.15, 0.10])
-        self.ax_radio.set_facecolor('#f0f0f0')
-        self.radio = RadioButtons(self.ax_radio, ('Dot Product', 'Cross Product'), activecolor=COLORS['v1'])
-        self.radio.on_clicked(self.update)
+        self.ax_mode = self.fig.add_axes([0.80, 0.90, 0.15, 0.06])
+        self.btn_mode = Button(self.ax_mode, 'Mode: Dot Product', color='#f0f0f0', hovercolor='#dce8ff')
+        self.btn_mode.label.set_color(COLORS['v1'])
+        self.btn_mode.label.set_fontweight('bold')
+        self.btn_mode.on_clicked(self._on_mode)
         
         self.setup_sliders()
+        self.build_artists()
+
+        # Static content is rendered by a full draw and cached; slider events
+        # then only restore it and blit the animated artists on top.
+        self._bg = None             # side -> cached background of its region
+        self._mode_changed = False
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Slider bursts are coalesced to ~60 Hz; once dragging stops for a
+        # moment, one full draw cleans up whatever the blits left behind.
+        self._pending = set()
+        self._timer = self.fig.canvas.new_timer(interval=16)
+        self._timer.single_shot = True
+        self._timer.add_callback(self._flush)
+        self._settle_timer = self.fig.canvas.new_timer(interval=200)
+        self._settle_timer.single_shot = True
+        self._settle_timer.add_callback(self.fig.canvas.draw_idle)
         self.update(None)
 
     def setup_sliders(self):
@@ -52,99 +111,241 @@ class DualVectorVisualizer:
         self.sl_v2x = Slider(self.fig.add_axes([0.6, 0.10, 0.3, 0.03]), 'V2x', -5, 5, valinit=-1.0, color=COLORS['v2'])
         self.sl_v2y = Slider(self.fig.add_axes([0.6, 0.05, 0.3, 0.03]), 'V2y', -5, 5, valinit=3.0, color=COLORS['v2'])
 
-        # Attach update function
-        for s in [self.sl_sigma, self.sl_ex, self.sl_ey, self.sl_v1x, self.sl_v1y, self.sl_v2x, self.sl_v2y]:
-            s.on_changed(self.update)
+        # Attach update function: each side only redraws its own region
+        self._slider_parts = {'left': [], 'right': []}
+        self._sliders = {'left': [], 'right': []}
+        for side, cb, sliders in (('left', self._update_left, [self.sl_sigma, self.sl_ex, self.sl_ey]),
+                                  ('right', self._update_right, [self.sl_v1x, self.sl_v1y, self.sl_v2x, self.sl_v2y])):
+            for s in sliders:
+                s.on_changed(cb)
+                self._sliders[side].append(s)
+                # update() blits the moving parts of the slider itself
+                s.drawon = False
+                self._slider_parts[side] += [s.poly, s.valtext]
+                if hasattr(s, '_handle'):
+                    self._slider_parts[side].append(s._handle)
 
     def draw_grid(self, ax, title):
-        ax.clear()
+        # Called once per axes; only the title ever changes afterwards
         ax.grid(True, which='both', color=COLORS['grid'], linestyle='-')
         ax.axhline(0, color='black', linewidth=1)
         ax.axvline(0, color='black', linewidth=1)
         ax.set_xlim(-8, 8)
         ax.set_ylim(-8, 8)
         ax.set_aspect('equal')
-        ax.set_title(title, fontweight='bold', pad=10)
+        return ax.set_title(title, fontweight='bold', pad=10)
+
+    def make_arrow(self, ax, color, label=''):
+        arrow = ax.add_patch(FancyArrowPatch((0, 0), (1, 0), arrowstyle='-|>', color=color,
+                                             lw=2, mutation_scale=15))
+        text = ax.text(0, 0, label, color=color, fontweight='bold', bbox=LABEL_BBOX, clip_on=True)
+        return arrow, text
+
+    def update_arrow(self, art, vec, label=None, origin=(0,0)):
+        arrow, text = art
+        tip = (origin[0]+vec[0], origin[1]+vec[1])
 
-    def draw_arrow(self, ax, vec, color, label, origin=(0,0)):
-        ax.annotate('', xy=(origin[0]+vec[0], origin[1]+vec[1]), xytext=origin,
-                    arrowprops=dict(arrowstyle='-|>', color=color, lw=2, mutation_scale=15))
-        
         # Offset label slightly based on vector direction
-        offset_x = 0.3 if vec[0] >= 0 else -0.8
-        offset_y = 0.3 if vec[1] >= 0 else -0.8
-        ax.text(origin[0]+vec[0]+offset_x, origin[1]+vec[1]+offset_y, label, color=color, fontweight='bold',
-                bbox=dict(boxstyle="round,pad=0.1", fc="white", ec="none", alpha=0.7))
+        pos = (tip[0]+LABEL_OFFSET[vec[0] >= 0], tip[1]+LABEL_OFFSET[vec[1] >= 0])
+        if pos != text.get_position():   # untouched sliders leave the arrow as is
+            arrow.set_positions(origin, tip)
+            text.set_position(pos)
+        if label is not None and label != text.get_text():
+            text.set_text(label)
+
+    def make_formula(self, ax, eq, color='black'):
+        """(mathtext prefix, plain value, plain status line) for a formula box."""
+        kw = dict(va='center', fontsize=12, fontweight='bold', color=color, clip_on=True)
+        return (ax.text(0.5, 0.72, eq, ha='right', **kw),
+                ax.text(0.5, 0.72, '', ha='left', **kw),
+                ax.text(0.5, 0.22, '', ha='center', **kw))
+
+    def build_artists(self):
+        """Create every value-dependent artist once; updates only mutate them."""
+        self._mode = 'Dot Product'
+        self.draw_grid(self.ax_left, "Scalar × Vector (Scaling)")
+        self._title_r = self.draw_grid(self.ax_right, f"Vector × Vector ({self._mode})")
+
+        # Left
+        self._trail = deque(maxlen=TRAIL_LEN)            # past (x, y) result tips
+        self._trail_seg = np.zeros((TRAIL_LEN, 2, 2))   # origin -> tip; only the tips change
+        self._trail_lc = LineCollection([], colors=COLORS['res'], linewidths=2, alpha=0.15)
+        self.ax_left.add_collection(self._trail_lc)
+        self._in = self.make_arrow(self.ax_left, COLORS['v1'], "Input")
+        self._out = self.make_arrow(self.ax_left, COLORS['res'])
+        self._eq_l, self._val_l, self._res_l = self.make_formula(self.ax_txt_l, EQ_LEFT, COLORS['res'])
+        self._res_l.set_text("Result is a VECTOR.")
+
+        # Right
+        self._v1 = self.make_arrow(self.ax_right, COLORS['v1'], "V1")
+        self._v2 = self.make_arrow(self.ax_right, COLORS['v2'], "V2")
+        self._proj_dashed, = self.ax_right.plot([], [], '--', color='gray')
+        self._proj_solid, = self.ax_right.plot([], [], color='orange', lw=4, alpha=0.5)
+        self._proj_text = self.ax_right.text(0, 0, " Projection", color='orange', fontsize=9,
+                                             clip_on=True)
+        self._cross_marker, = self.ax_right.plot([0], [0], markeredgewidth=2)
+        self._txt_r = self.make_formula(self.ax_txt_r, EQ_RIGHT[self._mode])
+        # Cross-product unit vector, kept as its own mathtext artist that
+        # follows the right edge of the plain-text value
+        self._txt_r += (self.ax_txt_r.annotate(
+            r"$\hat{k}$", xy=(1, 0.5), xycoords=self._txt_r[1], xytext=(3, 0),
+            textcoords='offset points', va='center', fontsize=12, clip_on=True),)
+
+        self._side_artists = {
+            'left': [self._trail_lc, *self._in, *self._out, self._val_l, *self._slider_parts['left']],
+            'right': [*self._v1, *self._v2, self._proj_dashed, self._proj_solid,
+                      self._proj_text, self._cross_marker, *self._txt_r, *self._slider_parts['right']]}
+        self._dynamic = self._side_artists['left'] + self._side_artists['right']
+        # Dynamic texts are clipped to these axes, so a side's pixels never
+        # leave them (plus the slider value texts beside its sliders)
+        self._side_axes = {
+            'left': [self.ax_left, self.ax_txt_l, *(s.ax for s in self._sliders['left'])],
+            'right': [self.ax_right, self.ax_txt_r, *(s.ax for s in self._sliders['right'])]}
+        for a in self._dynamic:
+            a.set_animated(True)
 
-    def update(self, val):
-        self.draw_left()
-        self.draw_right()
-        self.fig.canvas.draw_idle()
+    def _side_region(self, side, renderer):
+        boxes = [ax.bbox for ax in self._side_axes[side]]
+        room = 0.05 * self.fig.bbox.width    # value text grows to the right of its slider
+        for s in self._sliders[side]:
+            b = s.ax.bbox
+            boxes += [Bbox.from_extents(b.x1, b.y0, b.x1 + room, b.y1),
+                      s.valtext.get_window_extent(renderer)]
+        u = Bbox.union(boxes)
+        return Bbox.from_extents(u.x0 - 1, u.y0 - 1, u.x1 + 1, u.y1 + 1)
+
+    def _on_draw(self, event):
+        # Also fires after a resize, so the backgrounds always match the canvas
+        renderer = self.fig.canvas.get_renderer()
+        self._regions = {side: self._side_region(side, renderer) for side in self._side_axes}
+        self._bg = {side: self.fig.canvas.copy_from_bbox(r) for side, r in self._regions.items()}
+        self._mode_changed = False
+        self._draw_dynamic()
+
+    def _draw_dynamic(self):
+        for a in self._dynamic:
+            self.fig.draw_artist(a)
+
+    def _on_mode(self, event):
+        label = 'Cross Product' if self._mode == 'Dot Product' else 'Dot Product'
+        self._mode = label
+        self.btn_mode.label.set_text(f"Mode: {label}")
+        # Title is part of the cached background: needs a full redraw
+        self._title_r.set_text(f"Vector × Vector ({label})")
+        self._txt_r[0].set_text(EQ_RIGHT[label])
+        self._mode_changed = True
+        self.update(None, ('right',))
+
+    def _update_left(self, val):
+        self._schedule('left')
+
+    def _update_right(self, val):
+        self._schedule('right')
+
+    def _schedule(self, side):
+        if not self._pending:
+            self._timer.start()
+        self._pending.add(side)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        sides, self._pending = self._pending, set()
+        self.update(None, sides)
+        self._settle_timer.stop()
+        self._settle_timer.start()
+
+    def update(self, val, sides=('left', 'right')):
+        if 'left' in sides:
+            self.draw_left()
+        if 'right' in sides:
+            self.draw_right()
+        if self._bg is None or self._mode_changed:
+            # A full draw is queued (or about to be); blitting now would only
+            # paint over a stale background, and draw_idle itself coalesces.
+            self.fig.canvas.draw_idle()
+            return
+        for side in sides:
+            self.fig.canvas.restore_region(self._bg[side])
+            for a in self._side_artists[side]:
+                self.fig.draw_artist(a)
+            self.fig.canvas.blit(self._regions[side])
 
     # ==========================================================================
     # LEFT PLOT: SCALAR x VECTOR
     # ==========================================================================
     def draw_left(self):
-        self.draw_grid(self.ax_left, "Scalar × Vector (Scaling)")
-        self.ax_txt_l.clear(); self.ax_txt_l.axis('off')
-
         sigma = self.sl_sigma.val
-        V_in = np.array([self.sl_ex.val, self.sl_ey.val])
-        V_out = sigma * V_in
+        V_in = (self.sl_ex.val, self.sl_ey.val)
+        V_out = compute_left(sigma, *V_in)
+        self.draw_trail(V_out)
 
         # Draw Vectors
-        self.draw_arrow(self.ax_left, V_in, COLORS['v1'], "Input")
-        self.draw_arrow(self.ax_left, V_out, COLORS['res'], f"Result ({sigma:.1f}×)")
+        self.update_arrow(self._in, V_in)
+        self.update_arrow(self._out, V_out, f"Result ({sigma:.1f}×)")
 
         # Status Text
-        self.ax_txt_l.text(0.5, 0.5, f"$\\vec{{V}}_{{out}} = {sigma:.1f} \\cdot \\vec{{V}}_{{in}}$\nResult is a VECTOR.", 
-                           ha='center', va='center', fontsize=12, color=COLORS['res'], fontweight='bold')
+        self._val_l.set_text(f" {sigma:.1f}")
+
+    def draw_trail(self, tip):
+        if self._trail and self._trail[-1] == tip:
+            return   # result unchanged (e.g. only the other side moved)
+        self._trail.append(tip)
+        n = len(self._trail)
+        self._trail_seg[:n, 1] = self._trail
+        self._trail_lc.set_segments(self._trail_seg[:n])
 
     # ==========================================================================
     # RIGHT PLOT: VECTOR x VECTOR
     # ==========================================================================
     def draw_right(self):
-        mode = self.radio.value_selected
-        self.draw_grid(self.ax_right, f"Vector × Vector ({mode})")
-        self.ax_txt_r.clear(); self.ax_txt_r.axis('off')
-
-        v1 = np.array([self.sl_v1x.val, self.sl_v1y.val])
-        v2 = np.array([self.sl_v2x.val, self.sl_v2y.val])
+        mode = self._mode
+        v1x, v1y = self.sl_v1x.val, self.sl_v1y.val
+        v2x, v2y = self.sl_v2x.val, self.sl_v2y.val
+        dot, cross_z, proj_x, proj_y, v2n2 = compute_right(v1x, v1y, v2x, v2y)
 
         # Draw Vectors
-        self.draw_arrow(self.ax_right, v1, COLORS['v1'], "V1")
-        self.draw_arrow(self.ax_right, v2, COLORS['v2'], "V2")
+        self.update_arrow(self._v1, (v1x, v1y))
+        self.update_arrow(self._v2, (v2x, v2y))
 
-        if mode == 'Dot Product':
-            dot = np.dot(v1, v2)
+        is_dot = mode == 'Dot Product'
+        self._cross_marker.set_visible(not is_dot)
+        self._txt_r[3].set_visible(not is_dot)
+
+        if is_dot:
             res_col = COLORS['res'] if dot >= 0 else COLORS['neg']
             
-            self.ax_txt_r.text(0.5, 0.5, f"$\\vec{{V}}_1 \\cdot \\vec{{V}}_2 = {dot:.2f}$\nResult is a SCALAR.", 
-                               ha='center', va='center', fontsize=12, color=res_col, fontweight='bold')
+            value, result = f" {dot:.2f}", "Result is a SCALAR."
             
             # Show Projection for visual intuition
-            v2_norm = np.linalg.norm(v2)
-            if v2_norm > 0:
-                proj = (dot / (v2_norm**2)) * v2
-                self.ax_right.plot([v1[0], proj[0]], [v1[1], proj[1]], '--', color='gray')
-                self.ax_right.plot([0, proj[0]], [0, proj[1]], color='orange', lw=4, alpha=0.5)
-                self.ax_right.text(proj[0], proj[1], " Projection", color='orange', fontsize=9)
-
+            show_proj = v2n2 > 1e-12
+            if show_proj:
+                self._proj_dashed.set_data((v1x, proj_x), (v1y, proj_y))
+                self._proj_solid.set_data((0, proj_x), (0, proj_y))
+                self._proj_text.set_position((proj_x, proj_y))
         else: # Cross Product
-            cross_z = np.cross(v1, v2)
+            show_proj = False
             res_col = COLORS['res'] if cross_z >= 0 else COLORS['neg']
             
             # Determine Z-axis direction text
             dir_str = "OUT of page ⊙" if cross_z > 0 else "INTO page ⊗"
             if abs(cross_z) < 0.1: dir_str = "Zero"
             
-            self.ax_txt_r.text(0.5, 0.5, f"$\\vec{{V}}_1 \\times \\vec{{V}}_2 = {cross_z:.2f} \\hat{{k}}$\nResult is a VECTOR ({dir_str}).", 
-                               ha='center', va='center', fontsize=12, color=res_col, fontweight='bold')
+            value, result = f" {cross_z:.2f}", f"Result is a VECTOR ({dir_str})."
             
             # Draw Z-axis marker (Circle or X)
-            marker = 'o' if cross_z > 0 else 'x'
-            msize = 10 + min(abs(cross_z)*2, 40) # Scale marker size by magnitude
-            self.ax_right.plot(0, 0, marker=marker, markersize=msize, color=res_col, markeredgewidth=2)
+            self._cross_marker.set_marker('o' if cross_z > 0 else 'x')
+            self._cross_marker.set_markersize(10 + min(abs(cross_z)*2, 40)) # Scale marker size by magnitude
+            self._cross_marker.set_color(res_col)
+
+        if show_proj != self._proj_solid.get_visible():
+            for a in (self._proj_dashed, self._proj_solid, self._proj_text):
+                a.set_visible(show_proj)
+
+        _, val, res, _ = self._txt_r
+        val.set_text(value); res.set_text(result)
+        for t in self._txt_r:
+            t.set_color(res_col)
 
 if __name__ == "__main__":
     app = DualVectorVisualizer()